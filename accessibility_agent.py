@@ -3,35 +3,303 @@
 AccessibilityAgent
 Agente de IA para Avaliação de Acessibilidade Web
 Alinhado com WCAG 2.2 e ABNT NBR 17225:2025
+
+Os exemplos das docstrings podem ser verificados com:
+    python -m doctest accessibility_agent.py
 """
 
+import asyncio
+from http.cookiejar import DefaultCookiePolicy
+from array import array
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
-from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass, field
-from enum import Enum
+from typing import Callable, Dict, List, Set, Tuple, Optional
+from dataclasses import dataclass, field, replace
+from functools import partial
+from itertools import islice
+from enum import Enum, IntEnum
+import os
 import re
+import stat
+import sys
+import weakref
 from urllib.parse import urljoin, urlparse
-import json
-from datetime import datetime
-import colorsys
+
+try:
+    import aiohttp
+except ImportError:  # Opcional: necessário apenas para avaliar_websites
+    aiohttp = None
+
+try:
+    import orjson
+except ImportError:  # Opcional: exportação JSON em C; usa json como alternativa
+    orjson = None
+
+try:
+    from blake3 import blake3 as _hash_conteudo
+except ImportError:  # Opcional: BLAKE2 da biblioteca padrão como alternativa
+    from hashlib import blake2b as _hash_conteudo
+
+try:
+    import lxml  # noqa: F401 - usado pelo BeautifulSoup como parser em C
+    PARSER_PADRAO = 'lxml'
+except ImportError:
+    PARSER_PADRAO = 'html.parser'
+
+# Máximo de bytes lidos de cada página; o excedente é descartado para limitar
+# memória e tempo de construção do DOM em páginas patológicas
+TAMANHO_MAXIMO_PAGINA = 5 * 1024 * 1024
+
+# Quantidade de relatórios mantidos no cache por conteúdo (LRU)
+TAMANHO_CACHE_RELATORIOS = 256
+
+# Expressões regulares compiladas uma única vez no carregamento do módulo
+_RE_CLASSE_LISTA = re.compile(r'list|item', re.I)
+_RE_LINK_SALTO = re.compile(r'^#')
+_RE_CLASSE_DECORATIVA = re.compile(r'icon|decor|bg|background', re.I)
+_RE_SEPARADOR_VIEWPORT = re.compile(r'[,;]')
+# Declarações de cor de texto e de fundo em um atributo style, em uma só passada
+_RE_DECLARACAO_COR = re.compile(r'(?:^|;)\s*(color|background(?:-color)?)\s*:\s*([^;]+)')
+# Valores cuja cor efetiva não se deduz do texto (gradientes, imagens, variáveis)
+_RE_COR_INDETERMINAVEL = re.compile(r'(?:gradient|url|var)\(')
+_RE_COR_HEX = re.compile(r'#([0-9a-f]{3,8})\b', re.I)
+_RE_COR_RGB = re.compile(
+    r'rgba?\(\s*(\d{1,3})\s*,\s*(\d{1,3})\s*,\s*(\d{1,3})\s*(?:,\s*([\d.]+)(%?)\s*)?\)', re.I
+)
+
+# Marcador exibido antes de cada severidade no relatório de console
+_EMOJI_SEVERIDADE = {"Crítico": "", "Grave": "", "Moderado": "", "Leve": ""}
+
+# Roles que tornam um elemento interativo alcançável pelo teclado
+_ROLES_TECLADO = frozenset({'button', 'link'})
+
+# Tipos de <input> que não precisam de label associado
+_TIPOS_INPUT_SEM_LABEL = frozenset({'hidden', 'submit', 'button', 'image'})
+
+# Valores de user-scalable na meta viewport que desativam o zoom
+_VALORES_SEM_ZOOM = frozenset({'no', '0'})
+
+# Elementos HTML5 de landmark esperados na estrutura da página
+_LANDMARKS_HTML5 = frozenset({'header', 'nav', 'main', 'footer', 'aside', 'section'})
+
+# Textos de link que não descrevem o destino (comparados já normalizados)
+_TEXTOS_LINK_GENERICOS = frozenset({
+    'clique aqui', 'clique', 'aqui', 'saiba mais', 'leia mais', 'mais',
+    'veja mais', 'ver mais', 'continue lendo', 'continuar lendo',
+    'acesse', 'acesse aqui', 'mais informações', 'detalhes', 'ver detalhes',
+    'link', 'este link', 'baixar', 'download',
+    'click here', 'click', 'here', 'read more', 'learn more', 'more',
+    'more info', 'details', 'continue reading', 'this link',
+})
+
+# Cores nomeadas mais comuns do CSS
+_CORES_NOMEADAS = {
+    'black': (0, 0, 0), 'white': (255, 255, 255), 'red': (255, 0, 0),
+    'lime': (0, 255, 0), 'green': (0, 128, 0), 'blue': (0, 0, 255),
+    'yellow': (255, 255, 0), 'cyan': (0, 255, 255), 'aqua': (0, 255, 255),
+    'magenta': (255, 0, 255), 'fuchsia': (255, 0, 255), 'silver': (192, 192, 192),
+    'gray': (128, 128, 128), 'grey': (128, 128, 128), 'maroon': (128, 0, 0),
+    'olive': (128, 128, 0), 'purple': (128, 0, 128), 'teal': (0, 128, 128),
+    'navy': (0, 0, 128), 'orange': (255, 165, 0),
+}
+
+# Canal sRGB (0-255) linearizado conforme a definição de luminância relativa
+# da WCAG, pré-calculado para trocar as potências por uma consulta à tabela
+_SRGB_LINEAR = tuple(
+    c / 255 / 12.92 if c / 255 <= 0.03928 else ((c / 255 + 0.055) / 1.055) ** 2.4
+    for c in range(256)
+)
+
+# Roles ARIA válidos (WAI-ARIA), em conjunto para consulta O(1)
+_ROLES_ARIA_VALIDOS = frozenset({
+    'alert', 'alertdialog', 'application', 'article', 'banner',
+    'button', 'checkbox', 'complementary', 'contentinfo', 'dialog',
+    'directory', 'document', 'form', 'grid', 'gridcell', 'group',
+    'heading', 'img', 'link', 'list', 'listbox', 'listitem',
+    'log', 'main', 'marquee', 'math', 'menu', 'menubar', 'menuitem',
+    'menuitemcheckbox', 'menuitemradio', 'navigation', 'note',
+    'option', 'presentation', 'progressbar', 'radio', 'radiogroup',
+    'region', 'row', 'rowgroup', 'rowheader', 'scrollbar', 'search',
+    'separator', 'slider', 'spinbutton', 'status', 'tab', 'tablist',
+    'tabpanel', 'textbox', 'timer', 'toolbar', 'tooltip', 'tree',
+    'treegrid', 'treeitem'
+})
+
+
+def _trecho_elemento(elem, limite: int = 100) -> str:
+    """
+    Trecho curto que identifica um elemento no relatório
+    
+    Monta apenas a tag de abertura com os três primeiros atributos, em vez de
+    serializar toda a subárvore com str(elem) para depois truncá-la.
+    """
+    attrs = ' '.join(
+        f'{nome}="{" ".join(valor) if isinstance(valor, list) else valor}"'
+        for nome, valor in islice(elem.attrs.items(), 3)
+    )
+    trecho = f'<{elem.name} {attrs}>' if attrs else f'<{elem.name}>'
+    return trecho[:limite]
+
+
+def _saida_descartada() -> bool:
+    """Indica se sys.stdout aponta para o dispositivo nulo (ex.: > /dev/null)"""
+    if os.name == 'nt':
+        # No Windows o fstat de qualquer dispositivo de caractere, inclusive
+        # o console, tem st_rdev zerado e não se distingue do NUL
+        return False
+    try:
+        if sys.stdout.isatty():
+            return False
+        saida = os.fstat(sys.stdout.fileno())
+        nulo = os.stat(os.devnull)
+    except (AttributeError, OSError, ValueError):
+        # Sem descritor de arquivo (StringIO, stdout ausente) ou sem devnull
+        return False
+    return stat.S_ISCHR(saida.st_mode) and saida.st_rdev == nulo.st_rdev
+
+
+def _data_atual() -> str:
+    """Data e hora atuais no formato usado nos relatórios"""
+    from datetime import datetime  # Sob demanda: usado só ao gerar relatórios
+    # Mesmo formato de strftime("%Y-%m-%d %H:%M:%S"), sem interpretar o padrão
+    return datetime.now().isoformat(sep=' ', timespec='seconds')
+
+
+def _normalizar_texto_link(texto: str) -> str:
+    """
+    Texto de link (já em minúsculas) na forma comparada com
+    _TEXTOS_LINK_GENERICOS: espaços colapsados, pontuação final removida
+    
+    >>> [_normalizar_texto_link(t) for t in ('saiba mais »', 'leia mais ›',
+    ...                                      'read more >', 'saiba mais»')]
+    ['saiba mais', 'leia mais', 'read more', 'saiba mais']
+    >>> _normalizar_texto_link('  clique    aqui... ')
+    'clique aqui'
+    """
+    return ' '.join(texto.split()).rstrip('.…»›>:! ')
+
+
+def _parse_viewport(content: str) -> Dict[str, str]:
+    """
+    Converte o content da meta viewport em {diretiva: valor}, em minúsculas
+    
+    >>> _parse_viewport('width=device-width, initial-scale=1.0; User-Scalable=NO')
+    {'width': 'device-width', 'initial-scale': '1.0', 'user-scalable': 'no'}
+    >>> _parse_viewport(' maximum-scale = 10 ,, shrink-to-fit')
+    {'maximum-scale': '10'}
+    >>> _parse_viewport('')
+    {}
+    """
+    diretivas = {}
+    for parte in _RE_SEPARADOR_VIEWPORT.split(content.lower()):
+        chave, igual, valor = parte.partition('=')
+        if igual:
+            diretivas[chave.strip()] = valor.strip()
+    return diretivas
+
+
+def _extrair_cor(valor: str) -> Optional[Tuple[int, int, int]]:
+    """
+    Converte um valor de cor CSS (hex, rgb()/rgba() ou nome) em RGB
+    
+    Retorna None quando a cor não pode ser determinada: transparências,
+    gradientes, imagens, variáveis CSS e nomes desconhecidos.
+    
+    >>> _extrair_cor('#fff'), _extrair_cor('#777777'), _extrair_cor('#000F')
+    ((255, 255, 255), (119, 119, 119), (0, 0, 0))
+    >>> _extrair_cor('#102030ff'), _extrair_cor('#10203080'), _extrair_cor('#fff8')
+    ((16, 32, 48), None, None)
+    >>> _extrair_cor('rgba(10, 20, 30, 1)'), _extrair_cor('rgba(10, 20, 30, 0.5)')
+    ((10, 20, 30), None)
+    >>> _extrair_cor('rgba(10, 20, 30, 100%)'), _extrair_cor('White !important')
+    ((10, 20, 30), (255, 255, 255))
+    >>> [_extrair_cor(v) for v in ('linear-gradient(#000, #fff)',
+    ...                            'url(fundo.png) #fff', 'var(--cor, #123)')]
+    [None, None, None]
+    """
+    valor = valor.replace('!important', '').strip().lower()
+    
+    # As paradas de cor dentro deles não são a cor do fundo/texto
+    if _RE_COR_INDETERMINAVEL.search(valor):
+        return None
+    
+    m = _RE_COR_RGB.search(valor)
+    if m:
+        r, g, b, alfa, porcento = m.groups()
+        if alfa is not None and float(alfa) < (100 if porcento else 1):
+            return None
+        return tuple(min(int(c), 255) for c in (r, g, b))
+    
+    m = _RE_COR_HEX.search(valor)
+    if m:
+        digitos = m.group(1)
+        if len(digitos) in (3, 4):
+            digitos = ''.join(d * 2 for d in digitos)
+        if len(digitos) == 8 and digitos[6:] != 'ff':
+            return None
+        if len(digitos) not in (6, 8):
+            return None
+        return tuple(int(digitos[i:i + 2], 16) for i in (0, 2, 4))
+    
+    for token in valor.split():
+        if token in _CORES_NOMEADAS:
+            return _CORES_NOMEADAS[token]
+    
+    return None
+
+
+def _razao_contraste(cor1: Tuple[int, int, int], cor2: Tuple[int, int, int]) -> float:
+    """
+    Razão de contraste WCAG entre duas cores RGB (de 1 a 21)
+    
+    >>> round(_razao_contraste((119, 119, 119), (255, 255, 255)), 2)
+    4.48
+    >>> _razao_contraste((0, 0, 0), (255, 255, 255))
+    21.0
+    """
+    lum1 = 0.2126 * _SRGB_LINEAR[cor1[0]] + 0.7152 * _SRGB_LINEAR[cor1[1]] + 0.0722 * _SRGB_LINEAR[cor1[2]]
+    lum2 = 0.2126 * _SRGB_LINEAR[cor2[0]] + 0.7152 * _SRGB_LINEAR[cor2[1]] + 0.0722 * _SRGB_LINEAR[cor2[2]]
+    if lum1 < lum2:
+        lum1, lum2 = lum2, lum1
+    return (lum1 + 0.05) / (lum2 + 0.05)
+
 
 class NivelConformidade(Enum):
-    """Níveis de conformidade WCAG 2.2"""
-    A = "A"
-    AA = "AA"
-    AAA = "AAA"
+    """Níveis de conformidade WCAG 2.2 (rótulo, posição)"""
+    A = ("A", 0)
+    AA = ("AA", 1)
+    AAA = ("AAA", 2)
+    
+    def __new__(cls, rotulo: str, ordem: int):
+        membro = object.__new__(cls)
+        membro._value_ = rotulo
+        membro.ordem = ordem  # Valor guardado nas colunas de ColunasProblemas
+        return membro
 
 
 class SeveridadeProblema(Enum):
-    """Severidade dos problemas encontrados"""
-    CRITICO = "Crítico"
-    GRAVE = "Grave"
-    MODERADO = "Moderado"
-    LEVE = "Leve"
+    """Severidade dos problemas encontrados (rótulo, peso na pontuação, posição)"""
+    CRITICO = ("Crítico", 10, 0)
+    GRAVE = ("Grave", 5, 1)
+    MODERADO = ("Moderado", 2, 2)
+    LEVE = ("Leve", 1, 3)
+    
+    def __new__(cls, rotulo: str, peso: int, ordem: int):
+        membro = object.__new__(cls)
+        membro._value_ = rotulo  # O valor continua sendo o rótulo exibido
+        membro.peso = peso
+        membro.ordem = ordem  # Valor guardado nas colunas de ColunasProblemas
+        return membro
+
 
+# (severidade, rótulo) na ordem de exibição do relatório
+_ROTULOS_SEVERIDADE = tuple((s, s.value) for s in SeveridadeProblema)
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ProblemaAcessibilidade:
     """Representa um problema de acessibilidade encontrado"""
     criterio: str
@@ -46,7 +314,13 @@ class ProblemaAcessibilidade:
     codigo_exemplo: str = ""
 
 
-@dataclass
+# Memo de RelatorioAcessibilidade.to_json_dict, por id() do relatório. Fica
+# fora dos campos para não aparecer em fields()/asdict(); cada entrada é
+# removida por weakref.finalize quando o relatório é coletado.
+_DADOS_JSON: Dict[int, dict] = {}
+
+
+@dataclass(slots=True, frozen=True, weakref_slot=True)
 class RelatorioAcessibilidade:
     """Relatório completo de acessibilidade"""
     url: str
@@ -58,6 +332,468 @@ class RelatorioAcessibilidade:
     recomendacoes_priorizadas: List[str]
     conformidade_wcag: Dict[str, bool]
     conformidade_abnt: Dict[str, bool]
+    
+    def to_json_dict(self) -> dict:
+        """
+        Dados do relatório para exportação JSON, montados uma única vez.
+        O dict retornado é compartilhado entre chamadas: não o modifique.
+        """
+        dados = _DADOS_JSON.get(id(self))
+        if dados is None:
+            dados = _DADOS_JSON[id(self)] = {
+                'url': self.url,
+                'data_avaliacao': self.data_avaliacao,
+                'pontuacao_geral': self.pontuacao_geral,
+                'total_problemas': self.total_problemas,
+                'problemas_por_severidade': self.problemas_por_severidade,
+                'conformidade_wcag': self.conformidade_wcag,
+                'conformidade_abnt': self.conformidade_abnt,
+                'recomendacoes': self.recomendacoes_priorizadas,
+                'problemas': [_problema_para_dict(p) for p in self.problemas]
+            }
+            weakref.finalize(self, _DADOS_JSON.pop, id(self), None)
+        return dados
+    
+    def com_url(self, url: str) -> "RelatorioAcessibilidade":
+        """Cópia do relatório para outra URL, com data de avaliação atual"""
+        return self._copia(url=url, data_avaliacao=_data_atual())
+    
+    def _copia(self, **alteracoes) -> "RelatorioAcessibilidade":
+        """
+        Cópia com listas e dicts próprios: frozen não impede alterar o
+        conteúdo deles, e relatórios servidos dos caches não devem
+        compartilhá-los com a entrada armazenada
+        """
+        return replace(
+            self,
+            problemas_por_severidade=dict(self.problemas_por_severidade),
+            problemas=list(self.problemas),
+            recomendacoes_priorizadas=list(self.recomendacoes_priorizadas),
+            conformidade_wcag=dict(self.conformidade_wcag),
+            conformidade_abnt=dict(self.conformidade_abnt),
+            **alteracoes
+        )
+
+
+@dataclass(slots=True)
+class IndiceProblemas:
+    """Contagens dos problemas encontrados, calculadas a partir de ColunasProblemas"""
+    severidade_counts: Dict[SeveridadeProblema, int] = field(default_factory=dict)
+    nivel_counts: Dict[NivelConformidade, int] = field(default_factory=dict)
+    categoria_counts: Counter = field(default_factory=Counter)
+    abnt_violados: Set[str] = field(default_factory=set)  # Seções, ex.: "5.1"
+
+
+@dataclass(slots=True)
+class ColunasProblemas:
+    """
+    Campos dos problemas usados nas contagens do relatório, copiados em
+    colunas compactas (array.array) conforme os problemas são registrados.
+    As contagens viram reduções em C sobre bytes, sem percorrer os objetos.
+    """
+    severidades: array = field(default_factory=lambda: array('b'))  # .ordem
+    niveis: array = field(default_factory=lambda: array('b'))  # .ordem
+    categorias: array = field(default_factory=lambda: array('H'))  # id
+    # Categoria ("1.1.1") -> id, na ordem em que apareceu pela primeira vez
+    ids_categorias: Dict[str, int] = field(default_factory=dict)
+    id_por_criterio: Dict[str, int] = field(default_factory=dict)
+    # Referência ABNT -> seção ("ABNT 5.1 - ..." -> "5.1"); toda referência
+    # registrada aparece em ao menos um problema
+    secoes_abnt: Dict[str, str] = field(default_factory=dict)
+    
+    def registrar(self, p: ProblemaAcessibilidade):
+        """Copia os campos de um problema para as colunas"""
+        self.severidades.append(p.severidade.ordem)
+        self.niveis.append(p.nivel_wcag.ordem)
+        
+        # Critérios e referências se repetem: cada texto distinto é
+        # decomposto uma única vez
+        id_categoria = self.id_por_criterio.get(p.criterio)
+        if id_categoria is None:
+            categoria = p.criterio.partition('-')[0].strip()
+            id_categoria = self.ids_categorias.setdefault(categoria, len(self.ids_categorias))
+            self.id_por_criterio[p.criterio] = id_categoria
+        self.categorias.append(id_categoria)
+        
+        referencia = p.referencia_abnt
+        if referencia and referencia not in self.secoes_abnt:
+            self.secoes_abnt[referencia] = referencia.partition('-')[0].removeprefix('ABNT').strip()
+
+
+def _problema_para_dict(p: ProblemaAcessibilidade) -> Dict[str, str]:
+    """Representação de um problema na exportação JSON"""
+    return {
+        'criterio': p.criterio,
+        'descricao': p.descricao,
+        'severidade': p.severidade.value,
+        'nivel_wcag': p.nivel_wcag.value,
+        'sugestao': p.sugestao,
+        'referencia_wcag': p.referencia_wcag,
+        'referencia_abnt': p.referencia_abnt,
+        'codigo_exemplo': p.codigo_exemplo
+    }
+
+
+class Criterio(IntEnum):
+    """Critérios WCAG 2.2 com correspondência na ABNT NBR 17225:2025"""
+    C_1_1_1 = 0
+    C_1_3_1 = 1
+    C_1_4_3 = 2
+    C_2_1_1 = 3
+    C_2_4_1 = 4
+    C_2_4_2 = 5
+    C_3_1_1 = 6
+    C_4_1_1 = 7
+    C_4_1_2 = 8
+
+
+# Referência ABNT NBR 17225:2025 de cada critério, indexada por Criterio
+_NORMA = (
+    "ABNT 5.1 - Alternativas em texto",  # 1.1.1
+    "ABNT 5.3 - Estrutura semântica",  # 1.3.1
+    "ABNT 5.4.3 - Contraste mínimo",  # 1.4.3
+    "ABNT 6.1 - Navegação por teclado",  # 2.1.1
+    "ABNT 6.4.1 - Bypass de blocos",  # 2.4.1
+    "ABNT 6.4.2 - Títulos de página",  # 2.4.2
+    "ABNT 7.1 - Idioma da página",  # 3.1.1
+    "ABNT 8.1 - Parsing HTML",  # 4.1.1
+    "ABNT 8.2 - Nome, função e valor",  # 4.1.2
+)
+
+# Mapeamento de critérios WCAG 2.2 para ABNT NBR 17225:2025, por código
+MAPEAMENTO_NORMAS = {
+    criterio.name[2:].replace('_', '.'): _NORMA[criterio] for criterio in Criterio
+}
+
+# Modelos de problemas: os campos constantes de cada regra ficam fixados aqui,
+# e cada ocorrência informa apenas descrição e elemento
+_PROB_IMG_SEM_ALT = partial(
+    ProblemaAcessibilidade,
+    criterio="1.1.1 - Alternativas em Texto",
+    severidade=SeveridadeProblema.CRITICO,
+    nivel_wcag=NivelConformidade.A,
+    sugestao="Adicione um atributo alt descritivo para a imagem",
+    referencia_wcag="WCAG 2.2 - 1.1.1",
+    referencia_abnt=_NORMA[Criterio.C_1_1_1]
+)
+
+_PROB_IMG_ALT_VAZIO = partial(
+    ProblemaAcessibilidade,
+    criterio="1.1.1 - Alternativas em Texto",
+    severidade=SeveridadeProblema.GRAVE,
+    nivel_wcag=NivelConformidade.A,
+    sugestao="Forneça uma descrição textual significativa",
+    referencia_wcag="WCAG 2.2 - 1.1.1",
+    referencia_abnt=_NORMA[Criterio.C_1_1_1]
+)
+
+_PROB_INPUT_IMAGEM_SEM_ALT = partial(
+    ProblemaAcessibilidade,
+    criterio="1.1.1 - Alternativas em Texto",
+    severidade=SeveridadeProblema.CRITICO,
+    nivel_wcag=NivelConformidade.A,
+    sugestao="Adicione alt descrevendo a ação do botão",
+    referencia_wcag="WCAG 2.2 - 1.1.1",
+    referencia_abnt=_NORMA[Criterio.C_1_1_1],
+    codigo_exemplo='<input type="image" alt="Enviar formulário">'
+)
+
+_PROB_SEM_CABECALHOS = partial(
+    ProblemaAcessibilidade,
+    criterio="1.3.1 - Estrutura Semântica",
+    severidade=SeveridadeProblema.GRAVE,
+    nivel_wcag=NivelConformidade.A,
+    sugestao="Use cabeçalhos para estruturar o conteúdo",
+    referencia_wcag="WCAG 2.2 - 1.3.1",
+    referencia_abnt=_NORMA[Criterio.C_1_3_1],
+    codigo_exemplo="<h1>Título Principal</h1>\n<h2>Seção</h2>"
+)
+
+_PROB_MULTIPLOS_H1 = partial(
+    ProblemaAcessibilidade,
+    criterio="1.3.1 - Estrutura Semântica",
+    severidade=SeveridadeProblema.MODERADO,
+    nivel_wcag=NivelConformidade.A,
+    sugestao="Use apenas um H1 por página como título principal",
+    referencia_wcag="WCAG 2.2 - 1.3.1",
+    referencia_abnt=_NORMA[Criterio.C_1_3_1],
+    codigo_exemplo="<h1>Título único da página</h1>"
+)
+
+_PROB_SALTO_CABECALHO = partial(
+    ProblemaAcessibilidade,
+    criterio="1.3.1 - Estrutura Semântica",
+    severidade=SeveridadeProblema.MODERADO,
+    nivel_wcag=NivelConformidade.A,
+    sugestao="Não pule níveis de cabeçalho: desça um nível por vez (h2 → h3)",
+    referencia_wcag="WCAG 2.2 - 1.3.1",
+    referencia_abnt=_NORMA[Criterio.C_1_3_1],
+    codigo_exemplo="<h2>Seção</h2>\n<h3>Subseção</h3>"
+)
+
+_PROB_POUCOS_LANDMARKS = partial(
+    ProblemaAcessibilidade,
+    criterio="1.3.1 - Estrutura Semântica",
+    severidade=SeveridadeProblema.MODERADO,
+    nivel_wcag=NivelConformidade.A,
+    sugestao="Use <header>, <nav>, <main>, <footer> para estruturar",
+    referencia_wcag="WCAG 2.2 - 1.3.1",
+    referencia_abnt=_NORMA[Criterio.C_1_3_1],
+    codigo_exemplo="<header>...</header>\n<nav>...</nav>\n<main>...</main>"
+)
+
+_PROB_DIVS_COMO_LISTAS = partial(
+    ProblemaAcessibilidade,
+    criterio="1.3.1 - Estrutura Semântica",
+    severidade=SeveridadeProblema.LEVE,
+    nivel_wcag=NivelConformidade.A,
+    sugestao="Use <ul>, <ol> e <li> para listas",
+    referencia_wcag="WCAG 2.2 - 1.3.1",
+    referencia_abnt=_NORMA[Criterio.C_1_3_1],
+    codigo_exemplo="<ul>\n  <li>Item 1</li>\n  <li>Item 2</li>\n</ul>"
+)
+
+_PROB_CONTRASTE = partial(
+    ProblemaAcessibilidade,
+    criterio="1.4.3 - Contraste de Cores",
+    severidade=SeveridadeProblema.MODERADO,
+    nivel_wcag=NivelConformidade.AA,
+    sugestao="Razão de contraste mínima: 4.5:1 para texto normal, 3:1 para texto grande",
+    referencia_wcag="WCAG 2.2 - 1.4.3",
+    referencia_abnt=_NORMA[Criterio.C_1_4_3],
+    codigo_exemplo="Use ferramentas como WebAIM Contrast Checker"
+)
+
+_PROB_CONTRASTE_INSUFICIENTE = partial(
+    ProblemaAcessibilidade,
+    criterio="1.4.3 - Contraste de Cores",
+    severidade=SeveridadeProblema.GRAVE,
+    nivel_wcag=NivelConformidade.AA,
+    sugestao="Razão de contraste mínima: 4.5:1 para texto normal, 3:1 para texto grande",
+    referencia_wcag="WCAG 2.2 - 1.4.3",
+    referencia_abnt=_NORMA[Criterio.C_1_4_3],
+    codigo_exemplo='<p style="color: #595959; background-color: #ffffff">Texto (7:1)</p>'
+)
+
+_PROB_INTERATIVO_SEM_TECLADO = partial(
+    ProblemaAcessibilidade,
+    criterio="2.1.1 - Navegação por Teclado",
+    severidade=SeveridadeProblema.CRITICO,
+    nivel_wcag=NivelConformidade.A,
+    sugestao="Use elementos nativos (<button>, <a>) ou adicione tabindex='0' e role apropriado",
+    referencia_wcag="WCAG 2.2 - 2.1.1",
+    referencia_abnt=_NORMA[Criterio.C_2_1_1],
+    codigo_exemplo='<div role="button" tabindex="0" onkeypress="...">Clique</div>'
+)
+
+_PROB_SEM_SKIP_LINKS = partial(
+    ProblemaAcessibilidade,
+    criterio="2.4.1 - Bypass de Blocos",
+    severidade=SeveridadeProblema.GRAVE,
+    nivel_wcag=NivelConformidade.A,
+    sugestao="Adicione link 'Pular para conteúdo principal' no início da página",
+    referencia_wcag="WCAG 2.2 - 2.4.1",
+    referencia_abnt=_NORMA[Criterio.C_2_4_1],
+    codigo_exemplo='<a href="#main-content" class="skip-link">Pular para conteúdo</a>'
+)
+
+_PROB_CAMPO_SEM_LABEL = partial(
+    ProblemaAcessibilidade,
+    criterio="4.1.2 - Nome, Função e Valor",
+    severidade=SeveridadeProblema.CRITICO,
+    nivel_wcag=NivelConformidade.A,
+    sugestao="Associe um <label> ao campo ou use aria-label",
+    referencia_wcag="WCAG 2.2 - 4.1.2",
+    referencia_abnt=_NORMA[Criterio.C_4_1_2],
+    codigo_exemplo='<label for="nome">Nome:</label>\n<input type="text" id="nome">'
+)
+
+_PROB_OBRIGATORIO_SEM_ARIA = partial(
+    ProblemaAcessibilidade,
+    criterio="4.1.2 - Nome, Função e Valor",
+    severidade=SeveridadeProblema.LEVE,
+    nivel_wcag=NivelConformidade.A,
+    sugestao="Adicione aria-required='true' para leitores de tela",
+    referencia_wcag="WCAG 2.2 - 4.1.2",
+    referencia_abnt=_NORMA[Criterio.C_4_1_2],
+    codigo_exemplo='<input type="text" required aria-required="true">'
+)
+
+_PROB_VIDEO_SEM_LEGENDAS = partial(
+    ProblemaAcessibilidade,
+    criterio="1.2.2 - Legendas",
+    severidade=SeveridadeProblema.CRITICO,
+    nivel_wcag=NivelConformidade.A,
+    sugestao="Adicione <track kind='captions'> com legendas",
+    referencia_wcag="WCAG 2.2 - 1.2.2",
+    referencia_abnt="ABNT 5.2.2 - Legendas sincronizadas",
+    codigo_exemplo='<video>\n  <track kind="captions" src="legendas.vtt" srclang="pt-BR">\n</video>'
+)
+
+_PROB_VIDEO_AUTOPLAY = partial(
+    ProblemaAcessibilidade,
+    criterio="1.4.2 - Controle de Áudio",
+    severidade=SeveridadeProblema.GRAVE,
+    nivel_wcag=NivelConformidade.A,
+    sugestao="Remova autoplay ou forneça controle de pausa",
+    referencia_wcag="WCAG 2.2 - 1.4.2",
+    referencia_abnt="ABNT 5.4.2 - Controle de reprodução",
+    codigo_exemplo='<video controls>\n  <!-- sem autoplay -->\n</video>'
+)
+
+_PROB_AUDIO_AUTOPLAY = partial(
+    ProblemaAcessibilidade,
+    criterio="1.4.2 - Controle de Áudio",
+    severidade=SeveridadeProblema.GRAVE,
+    nivel_wcag=NivelConformidade.A,
+    sugestao="Remova autoplay de elementos de áudio",
+    referencia_wcag="WCAG 2.2 - 1.4.2",
+    referencia_abnt="ABNT 5.4.2 - Controle de reprodução",
+    codigo_exemplo='<audio controls src="audio.mp3"></audio>'
+)
+
+_PROB_SEM_TITULO = partial(
+    ProblemaAcessibilidade,
+    criterio="2.4.2 - Título da Página",
+    severidade=SeveridadeProblema.CRITICO,
+    nivel_wcag=NivelConformidade.A,
+    sugestao="Adicione <title> descritivo no <head>",
+    referencia_wcag="WCAG 2.2 - 2.4.2",
+    referencia_abnt=_NORMA[Criterio.C_2_4_2],
+    codigo_exemplo='<head>\n  <title>Nome da Página - Nome do Site</title>\n</head>'
+)
+
+_PROB_TITULO_CURTO = partial(
+    ProblemaAcessibilidade,
+    criterio="2.4.2 - Título da Página",
+    severidade=SeveridadeProblema.GRAVE,
+    nivel_wcag=NivelConformidade.A,
+    sugestao="Forneça título descritivo e significativo",
+    referencia_wcag="WCAG 2.2 - 2.4.2",
+    referencia_abnt=_NORMA[Criterio.C_2_4_2],
+    codigo_exemplo='<title>Página Inicial - Minha Empresa</title>'
+)
+
+_PROB_SEM_IDIOMA = partial(
+    ProblemaAcessibilidade,
+    criterio="3.1.1 - Idioma da Página",
+    severidade=SeveridadeProblema.CRITICO,
+    nivel_wcag=NivelConformidade.A,
+    sugestao="Adicione atributo lang no elemento html",
+    referencia_wcag="WCAG 2.2 - 3.1.1",
+    referencia_abnt=_NORMA[Criterio.C_3_1_1],
+    codigo_exemplo='<html lang="pt-BR">'
+)
+
+_PROB_LINK_VAZIO = partial(
+    ProblemaAcessibilidade,
+    criterio="2.4.4 - Finalidade do Link",
+    severidade=SeveridadeProblema.CRITICO,
+    nivel_wcag=NivelConformidade.A,
+    sugestao="Adicione texto descritivo ou aria-label",
+    referencia_wcag="WCAG 2.2 - 2.4.4",
+    referencia_abnt="ABNT 6.4.4 - Propósito dos links",
+    codigo_exemplo='<a href="/sobre" aria-label="Sobre nossa empresa">Saiba mais</a>'
+)
+
+_PROB_LINK_GENERICO = partial(
+    ProblemaAcessibilidade,
+    criterio="2.4.4 - Finalidade do Link",
+    severidade=SeveridadeProblema.MODERADO,
+    nivel_wcag=NivelConformidade.A,
+    sugestao="Use texto descritivo do destino do link",
+    referencia_wcag="WCAG 2.2 - 2.4.4",
+    referencia_abnt="ABNT 6.4.4 - Propósito dos links",
+    codigo_exemplo='<a href="/servicos">Conheça nossos serviços</a>'
+)
+
+_PROB_LINK_NOVA_JANELA = partial(
+    ProblemaAcessibilidade,
+    criterio="3.2.5 - Mudança de Contexto",
+    severidade=SeveridadeProblema.LEVE,
+    nivel_wcag=NivelConformidade.AAA,
+    sugestao="Avise que o link abre em nova janela",
+    referencia_wcag="WCAG 2.2 - 3.2.5",
+    referencia_abnt="ABNT 7.2 - Previsibilidade",
+    codigo_exemplo='<a href="..." target="_blank" rel="noopener">Link (abre em nova janela)</a>'
+)
+
+_PROB_TABELA_SEM_CAPTION = partial(
+    ProblemaAcessibilidade,
+    criterio="1.3.1 - Estrutura de Tabelas",
+    severidade=SeveridadeProblema.MODERADO,
+    nivel_wcag=NivelConformidade.A,
+    sugestao="Adicione <caption> descrevendo o propósito da tabela",
+    referencia_wcag="WCAG 2.2 - 1.3.1",
+    referencia_abnt=_NORMA[Criterio.C_1_3_1],
+    codigo_exemplo='<table>\n  <caption>Vendas por região em 2024</caption>\n  ...\n</table>'
+)
+
+_PROB_TABELA_SEM_TH = partial(
+    ProblemaAcessibilidade,
+    criterio="1.3.1 - Estrutura de Tabelas",
+    severidade=SeveridadeProblema.GRAVE,
+    nivel_wcag=NivelConformidade.A,
+    sugestao="Use <th> para células de cabeçalho e <thead> para agrupar",
+    referencia_wcag="WCAG 2.2 - 1.3.1",
+    referencia_abnt=_NORMA[Criterio.C_1_3_1],
+    codigo_exemplo='<table>\n  <thead>\n    <tr><th>Coluna 1</th><th>Coluna 2</th></tr>\n  </thead>\n  <tbody>...</tbody>\n</table>'
+)
+
+_PROB_TH_SEM_SCOPE = partial(
+    ProblemaAcessibilidade,
+    criterio="1.3.1 - Estrutura de Tabelas",
+    severidade=SeveridadeProblema.LEVE,
+    nivel_wcag=NivelConformidade.A,
+    sugestao="Adicione scope='col' ou scope='row' ao <th>",
+    referencia_wcag="WCAG 2.2 - 1.3.1",
+    referencia_abnt=_NORMA[Criterio.C_1_3_1],
+    codigo_exemplo='<th scope="col">Nome da Coluna</th>'
+)
+
+_PROB_ROLE_INVALIDO = partial(
+    ProblemaAcessibilidade,
+    criterio="4.1.2 - ARIA Válido",
+    severidade=SeveridadeProblema.GRAVE,
+    nivel_wcag=NivelConformidade.A,
+    sugestao="Use apenas roles ARIA válidos da especificação",
+    referencia_wcag="WCAG 2.2 - 4.1.2",
+    referencia_abnt=_NORMA[Criterio.C_4_1_2],
+    codigo_exemplo='<div role="navigation">...</div>'
+)
+
+_PROB_LABELLEDBY_INEXISTENTE = partial(
+    ProblemaAcessibilidade,
+    criterio="4.1.2 - ARIA Referências",
+    severidade=SeveridadeProblema.GRAVE,
+    nivel_wcag=NivelConformidade.A,
+    sugestao="Certifique-se que o ID referenciado existe na página",
+    referencia_wcag="WCAG 2.2 - 4.1.2",
+    referencia_abnt=_NORMA[Criterio.C_4_1_2],
+    codigo_exemplo='<h2 id="titulo-secao">Título</h2>\n<div aria-labelledby="titulo-secao">...</div>'
+)
+
+_PROB_SEM_VIEWPORT = partial(
+    ProblemaAcessibilidade,
+    criterio="1.4.10 - Reflow/Responsividade",
+    severidade=SeveridadeProblema.GRAVE,
+    nivel_wcag=NivelConformidade.AA,
+    sugestao="Adicione meta viewport para responsividade",
+    referencia_wcag="WCAG 2.2 - 1.4.10",
+    referencia_abnt="ABNT 5.4.10 - Adaptação visual",
+    codigo_exemplo='<meta name="viewport" content="width=device-width, initial-scale=1.0">'
+)
+
+_PROB_ZOOM_BLOQUEADO = partial(
+    ProblemaAcessibilidade,
+    criterio="1.4.4 - Redimensionamento de Texto",
+    severidade=SeveridadeProblema.CRITICO,
+    nivel_wcag=NivelConformidade.AA,
+    sugestao="Não bloqueie o zoom: remova user-scalable=no",
+    referencia_wcag="WCAG 2.2 - 1.4.4",
+    referencia_abnt="ABNT 5.4.4 - Redimensionamento",
+    codigo_exemplo='<meta name="viewport" content="width=device-width, initial-scale=1.0">'
+)
 
 
 class AgenteAcessibilidade:
@@ -66,28 +802,63 @@ class AgenteAcessibilidade:
     Implementa heurísticas baseadas em WCAG 2.2 e ABNT NBR 17225:2025
     """
     
-    def __init__(self):
+    # Verificações, na ordem do relatório, e as listas coletadas de que cada
+    # uma depende; None indica que a verificação também aponta ausências
+    # (título, idioma, cabeçalhos...) e por isso sempre é executada
+    _VERIFICACOES = (
+        ('_verificar_alternativas_texto', ('_imgs', '_inputs')),
+        ('_verificar_estrutura_semantica', None),
+        ('_verificar_contraste_cores', ('_styled',)),
+        ('_verificar_navegacao_teclado', None),
+        ('_verificar_formularios', ('_inputs',)),
+        ('_verificar_multimedia', ('_videos', '_audios')),
+        ('_verificar_titulos_pagina', None),
+        ('_verificar_idioma', None),
+        ('_verificar_links', ('_links',)),
+        ('_verificar_tabelas', ('_tables',)),
+        ('_verificar_aria', ('_roled', '_labelledby')),
+        ('_verificar_responsividade', None),
+    )
+    
+    def __init__(self, parser: str = PARSER_PADRAO, max_workers: int = 1):
+        """
+        Args:
+            parser: Parser HTML usado pelo BeautifulSoup ('lxml', 'html.parser'
+                ou 'html5lib'). O padrão é 'lxml' quando instalado.
+            max_workers: Threads usadas para executar as verificações em
+                paralelo; 1 (padrão) executa todas sequencialmente. Sob o
+                GIL as verificações, puro Python, não ganham com threads.
+        """
         self.problemas: List[ProblemaAcessibilidade] = []
+        self._colunas = ColunasProblemas()  # Espelho de self.problemas para contagens
         self.soup: Optional[BeautifulSoup] = None
         self.url: str = ""
+        self.parser = parser
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None  # Criado sob demanda
+        
+        # Sessão HTTP reaproveitada entre avaliações (pool de conexões
+        # TCP/TLS), criada no primeiro uso de avaliar_website
+        self._session: Optional[requests.Session] = None
+        
+        # Validadores (ETag/Last-Modified) e último relatório por URL, para
+        # requisições condicionais: uma resposta 304 dispensa nova análise.
+        # LRU limitado a TAMANHO_CACHE_RELATORIOS, como o cache por conteúdo.
+        self._condicionais: "OrderedDict[str, Tuple[Dict[str, str], RelatorioAcessibilidade]]" = OrderedDict()
+        
+        # Relatórios por resumo (hash) do conteúdo: páginas idênticas sob URLs
+        # diferentes (espelhos, redirecionamentos) são analisadas uma só vez
+        self._cache_conteudo: "OrderedDict[bytes, RelatorioAcessibilidade]" = OrderedDict()
         
         # Mapeamento de critérios WCAG 2.2 para ABNT NBR 17225:2025
-        self.mapeamento_normas = {
-            "1.1.1": "ABNT 5.1 - Alternativas em texto",
-            "1.3.1": "ABNT 5.3 - Estrutura semântica",
-            "1.4.3": "ABNT 5.4.3 - Contraste mínimo",
-            "2.1.1": "ABNT 6.1 - Navegação por teclado",
-            "2.4.1": "ABNT 6.4.1 - Bypass de blocos",
-            "2.4.2": "ABNT 6.4.2 - Títulos de página",
-            "3.1.1": "ABNT 7.1 - Idioma da página",
-            "4.1.1": "ABNT 8.1 - Parsing HTML",
-            "4.1.2": "ABNT 8.2 - Nome, função e valor",
-        }
+        self.mapeamento_normas = MAPEAMENTO_NORMAS
     
     def avaliar_website(self, url: str) -> RelatorioAcessibilidade:
         """
         Avalia a acessibilidade de um website
         
+        Apenas os primeiros TAMANHO_MAXIMO_PAGINA bytes da página são lidos.
+        
         Args:
             url: URL do website a ser avaliado
             
@@ -95,235 +866,513 @@ class AgenteAcessibilidade:
             RelatorioAcessibilidade com resultados da análise
         """
         self.url = url
-        self.problemas = []
+        self._definir_problemas([])
         
         try:
-            # Buscar conteúdo da página
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            self.soup = BeautifulSoup(response.content, 'html.parser')
+            # Buscar conteúdo da página (condicional, se já avaliada antes)
+            validadores, anterior = self._condicionais.get(url, (None, None))
+            with self._obter_sessao().get(url, timeout=10, stream=True,
+                                          headers=validadores) as response:
+                if response.status_code == 304 and anterior is not None:
+                    self._condicionais.move_to_end(url)
+                    # O DOM e as listas coletadas são da última página
+                    # analisada, possivelmente outra URL
+                    self.soup = None
+                    self._coletar_elementos()
+                    relatorio = anterior.com_url(url)
+                    self._definir_problemas(relatorio.problemas)
+                    return relatorio
+                
+                response.raise_for_status()
+                
+                partes = []
+                restante = TAMANHO_MAXIMO_PAGINA
+                for parte in response.iter_content(chunk_size=64 * 1024):
+                    partes.append(parte[:restante])
+                    restante -= len(parte)
+                    if restante <= 0:
+                        break
+                conteudo = b''.join(partes)
             
-            # Executar todas as verificações
-            self._verificar_alternativas_texto()
-            self._verificar_estrutura_semantica()
-            self._verificar_contraste_cores()
-            self._verificar_navegacao_teclado()
-            self._verificar_formularios()
-            self._verificar_multimedia()
-            self._verificar_titulos_pagina()
-            self._verificar_idioma()
-            self._verificar_links()
-            self._verificar_tabelas()
-            self._verificar_aria()
-            self._verificar_responsividade()
+            # Sem charset no Content-Type o requests supõe ISO-8859-1; nesse
+            # caso o BeautifulSoup deve detectar a codificação (meta, BOM)
+            charset_declarado = 'charset=' in response.headers.get('Content-Type', '').lower()
+            relatorio = self._analisar_html(
+                conteudo, response.encoding if charset_declarado else None
+            )
             
-            # Gerar relatório
-            return self._gerar_relatorio()
+            validadores = {}
+            if 'ETag' in response.headers:
+                validadores['If-None-Match'] = response.headers['ETag']
+            if 'Last-Modified' in response.headers:
+                validadores['If-Modified-Since'] = response.headers['Last-Modified']
+            if validadores:
+                self._condicionais[url] = (validadores, relatorio._copia())
+                self._condicionais.move_to_end(url)
+                if len(self._condicionais) > TAMANHO_CACHE_RELATORIOS:
+                    self._condicionais.popitem(last=False)
+            else:
+                # Validadores antigos não valem mais para esta URL
+                self._condicionais.pop(url, None)
+            
+            return relatorio
+            
+        except Exception as e:
+            print(f"Erro ao avaliar website: {str(e)}")
+            return self._gerar_relatorio_erro(str(e))
+    
+    async def avaliar_website_async(self, url: str,
+                                    session: Optional["aiohttp.ClientSession"] = None
+                                    ) -> RelatorioAcessibilidade:
+        """
+        Versão assíncrona de avaliar_website, baseada em aiohttp
+        
+        Args:
+            url: URL do website a ser avaliado
+            session: Sessão aiohttp compartilhada (opcional); sem ela,
+                uma sessão temporária é criada para esta avaliação
+            
+        Returns:
+            RelatorioAcessibilidade com resultados da análise
+        """
+        if aiohttp is None:
+            raise ImportError("A avaliação assíncrona requer o pacote 'aiohttp'")
+        
+        if session is None:
+            async with aiohttp.ClientSession() as session:
+                return await self.avaliar_website_async(url, session)
+        
+        self.url = url
+        self._definir_problemas([])
+        
+        try:
+            conteudo, encoding = await self._buscar_pagina(session, url)
+            return self._analisar_html(conteudo, encoding)
             
         except Exception as e:
             print(f"Erro ao avaliar website: {str(e)}")
             return self._gerar_relatorio_erro(str(e))
     
-    def _verificar_alternativas_texto(self):
+    async def avaliar_websites(self, urls: List[str]) -> List[RelatorioAcessibilidade]:
+        """
+        Avalia vários websites concorrentemente
+        
+        As requisições compartilham um único pool de conexões e cada URL é
+        analisada por uma instância própria do agente, já que o estado da
+        análise (soup, problemas) é por página.
+        
+        Args:
+            urls: URLs dos websites a serem avaliados
+            
+        Returns:
+            Lista de RelatorioAcessibilidade, na mesma ordem de urls
+        """
+        if aiohttp is None:
+            raise ImportError("A avaliação assíncrona requer o pacote 'aiohttp'")
+        
+        connector = aiohttp.TCPConnector(limit=32, ttl_dns_cache=300)
+        # DummyCookieJar: as URLs do lote não compartilham cookies entre si
+        async with aiohttp.ClientSession(connector=connector,
+                                         cookie_jar=aiohttp.DummyCookieJar()) as session:
+            return list(await asyncio.gather(*(
+                self._avaliar_isolado(session, url) for url in urls
+            )))
+    
+    async def _avaliar_isolado(self, session: "aiohttp.ClientSession",
+                               url: str) -> RelatorioAcessibilidade:
+        """Avalia uma URL com um agente próprio, liberando o DOM ao final"""
+        agente = type(self)(self.parser, self.max_workers)
+        agente._cache_conteudo = self._cache_conteudo
+        if self.max_workers > 1:
+            agente._executor = self._obter_executor()
+        try:
+            return await agente.avaliar_website_async(url, session)
+        finally:
+            agente._liberar_dom()
+    
+    async def _buscar_pagina(self, session: "aiohttp.ClientSession",
+                             url: str) -> Tuple[bytes, Optional[str]]:
+        """
+        Busca o conteúdo bruto de uma página com a sessão aiohttp
+        
+        Lê no máximo TAMANHO_MAXIMO_PAGINA bytes do corpo.
+        
+        Returns:
+            Tupla (conteúdo, charset declarado no Content-Type ou None)
+        """
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+            response.raise_for_status()
+            
+            partes = []
+            restante = TAMANHO_MAXIMO_PAGINA
+            async for parte in response.content.iter_chunked(64 * 1024):
+                partes.append(parte[:restante])
+                restante -= len(parte)
+                if restante <= 0:
+                    break
+            return b''.join(partes), response.charset
+    
+    def _analisar_html(self, conteudo: bytes,
+                       encoding: Optional[str] = None) -> RelatorioAcessibilidade:
+        """
+        Executa todas as verificações sobre o HTML de uma página
+        
+        Args:
+            conteudo: HTML bruto da página avaliada (self.url)
+            encoding: Codificação já conhecida do conteúdo; evita que o
+                BeautifulSoup tenha de detectá-la varrendo os bytes
+            
+        Returns:
+            RelatorioAcessibilidade com resultados da análise
+        """
+        chave = _hash_conteudo(conteudo).digest() + (encoding or '').encode()
+        relatorio = self._cache_conteudo.get(chave)
+        if relatorio is not None:
+            self._cache_conteudo.move_to_end(chave)
+            self.soup = None
+            self._coletar_elementos()  # Esvazia as listas da página anterior
+            relatorio = relatorio.com_url(self.url)
+            self._definir_problemas(relatorio.problemas)
+            return relatorio
+        
+        self.soup = BeautifulSoup(conteudo, self.parser, from_encoding=encoding)
+        self._coletar_elementos()
+        
+        # Executar as verificações aplicáveis. Elas apenas leem o DOM e
+        # devolvem seus próprios problemas, então podem rodar em paralelo; a
+        # junção segue a ordem de _VERIFICACOES para manter o relatório
+        # determinístico.
+        verificacoes = self._verificacoes_aplicaveis()
+        
+        if self.max_workers > 1:
+            executor = self._obter_executor()
+            resultados = list(executor.map(lambda verificar: verificar(), verificacoes))
+        else:
+            resultados = [verificar() for verificar in verificacoes]
+        
+        colunas = self._colunas
+        for problemas in resultados:
+            self.problemas.extend(problemas)
+            for problema in problemas:
+                colunas.registrar(problema)
+        
+        # Gerar relatório
+        relatorio = self._gerar_relatorio()
+        
+        self._cache_conteudo[chave] = relatorio._copia()
+        if len(self._cache_conteudo) > TAMANHO_CACHE_RELATORIOS:
+            self._cache_conteudo.popitem(last=False)
+        
+        return relatorio
+    
+    def _definir_problemas(self, problemas: List[ProblemaAcessibilidade]):
+        """Substitui self.problemas, reconstruindo self._colunas a partir deles"""
+        self.problemas = problemas
+        self._colunas = colunas = ColunasProblemas()
+        for problema in problemas:
+            colunas.registrar(problema)
+    
+    def _obter_sessao(self) -> requests.Session:
+        """Sessão HTTP do agente, criada no primeiro uso"""
+        if self._session is None:
+            self._session = requests.Session()
+            adaptador = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+            self._session.mount('https://', adaptador)
+            self._session.mount('http://', adaptador)
+            # Sem cookies entre avaliações: o resultado de uma URL não deve
+            # depender das páginas avaliadas antes (consentimento, testes A/B)
+            self._session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        return self._session
+    
+    def _obter_executor(self) -> ThreadPoolExecutor:
+        """Pool de threads das verificações, criado uma vez por agente"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+    
+    def _verificacoes_aplicaveis(self) -> Tuple[Callable[[], List[ProblemaAcessibilidade]], ...]:
+        """
+        Seleciona as verificações relevantes para a página coletada
+        
+        Uma verificação cujas listas de entrada estão todas vazias (ex.: sem
+        <table>, nenhuma verificação de tabelas) não tem o que apontar e é
+        omitida, junto com seu agendamento no pool de threads.
+        """
+        return tuple(
+            getattr(self, nome) for nome, entradas in self._VERIFICACOES
+            if entradas is None or any(getattr(self, lista) for lista in entradas)
+        )
+    
+    def _liberar_dom(self):
+        """
+        Descarta a árvore da página e as listas de elementos coletados
+        
+        A árvore do BeautifulSoup tem referências cíclicas (pai/filhos) e só
+        seria liberada pelo coletor de ciclos; decompose() a desfaz na hora,
+        de modo que uma avaliação em lote mantém no máximo um DOM em memória.
+        """
+        if self.soup is not None:
+            self.soup.decompose()
+            self.soup = None
+        self._coletar_elementos()  # Sem soup, apenas esvazia as listas
+    
+    def _coletar_elementos(self):
+        """
+        Percorre o DOM uma única vez, distribuindo os elementos de interesse
+        em listas consumidas pelas verificações (evita um find_all por regra)
+        """
+        self._imgs = []
+        self._inputs = []
+        self._headings = []
+        self._niveis_cabecalho = []  # Nível (1-6) de cada item de _headings
+        self._links = []
+        self._tables = []
+        self._videos = []
+        self._audios = []
+        self._interativos = []
+        self._divs_lista = []
+        self._styled = []
+        self._roled = []
+        self._labelledby = []
+        self._html = None
+        self._title = None
+        self._viewport = None  # Primeira <meta name="viewport">
+        self._id_set = set()
+        self._tag_set = set()  # Nomes de todas as tags presentes na página
+        self._label_for_ids = set()
+        self._inputs_em_label = set()  # id() dos campos contidos em um <label>
+        self._vistos = set()  # Chaves de _add_problema já registradas
+        
+        if self.soup is None:
+            return
+        
+        # Pilha dos ancestrais do elemento atual: ao desempilhar um elemento
+        # seu conteúdo terminou, o que permite saber, sem subir na árvore,
+        # se um campo está dentro de um <label>
+        abertos = []
+        dentro_label = 0
+        
+        for elem in self.soup.descendants:
+            nome = elem.name
+            if nome is None:  # Texto, comentários e afins
+                continue
+            attrs = elem.attrs
+            
+            pai = elem.parent
+            while abertos and abertos[-1] is not pai:
+                if abertos.pop().name == 'label':
+                    dentro_label -= 1
+            abertos.append(elem)
+            self._tag_set.add(nome)
+            
+            if 'id' in attrs:
+                self._id_set.add(attrs['id'])
+            if 'style' in attrs:
+                self._styled.append(elem)
+            if 'role' in attrs:
+                self._roled.append(elem)
+            if 'aria-labelledby' in attrs:
+                self._labelledby.append(elem)
+            
+            if nome == 'img':
+                self._imgs.append(elem)
+            elif nome in ('input', 'select', 'textarea'):
+                self._inputs.append(elem)
+                if dentro_label:
+                    self._inputs_em_label.add(id(elem))
+            elif nome == 'label':
+                dentro_label += 1
+                if 'for' in attrs:
+                    self._label_for_ids.add(attrs['for'])
+            elif nome in ('h1', 'h2', 'h3', 'h4', 'h5', 'h6'):
+                self._headings.append(elem)
+                self._niveis_cabecalho.append(int(nome[1]))
+            elif nome == 'a':
+                if 'href' in attrs:
+                    self._links.append(elem)
+            elif nome == 'table':
+                self._tables.append(elem)
+            elif nome in ('video', 'iframe'):
+                self._videos.append(elem)
+            elif nome == 'audio':
+                self._audios.append(elem)
+            elif nome in ('div', 'span'):
+                if 'onclick' in attrs:
+                    self._interativos.append(elem)
+                if nome == 'div' and any(_RE_CLASSE_LISTA.search(c) for c in elem.get('class', [])):
+                    self._divs_lista.append(elem)
+            elif nome == 'title':
+                if self._title is None:
+                    self._title = elem
+            elif nome == 'html':
+                if self._html is None:
+                    self._html = elem
+            elif nome == 'meta':
+                if self._viewport is None and attrs.get('name') == 'viewport':
+                    self._viewport = elem
+    
+    def _verificar_alternativas_texto(self) -> List[ProblemaAcessibilidade]:
         """
         WCAG 2.2 - 1.1.1 Conteúdo Não Textual (Nível A)
         ABNT NBR 17225:2025 - 5.1 Alternativas em texto
         """
+        problemas = []
+        
         # Verificar imagens sem alt
-        imagens = self.soup.find_all('img')
-        for img in imagens:
+        for img in self._imgs:
             alt = img.get('alt')
             src = img.get('src', 'src_desconhecido')
             
             if alt is None:
-                self.problemas.append(ProblemaAcessibilidade(
-                    criterio="1.1.1 - Alternativas em Texto",
+                self._add_problema(problemas, _PROB_IMG_SEM_ALT(
                     descricao=f"Imagem sem atributo alt: {src}",
-                    severidade=SeveridadeProblema.CRITICO,
-                    nivel_wcag=NivelConformidade.A,
-                    elemento=str(img)[:100],
-                    sugestao="Adicione um atributo alt descritivo para a imagem",
-                    referencia_wcag="WCAG 2.2 - 1.1.1",
-                    referencia_abnt=self.mapeamento_normas["1.1.1"],
+                    elemento=_trecho_elemento(img),
                     codigo_exemplo=f'<img src="{src}" alt="Descrição clara da imagem">'
-                ))
+                ), img)
             elif alt.strip() == "" and not self._is_decorative(img):
-                self.problemas.append(ProblemaAcessibilidade(
-                    criterio="1.1.1 - Alternativas em Texto",
+                self._add_problema(problemas, _PROB_IMG_ALT_VAZIO(
                     descricao=f"Imagem com alt vazio (não decorativa): {src}",
-                    severidade=SeveridadeProblema.GRAVE,
-                    nivel_wcag=NivelConformidade.A,
-                    elemento=str(img)[:100],
-                    sugestao="Forneça uma descrição textual significativa",
-                    referencia_wcag="WCAG 2.2 - 1.1.1",
-                    referencia_abnt=self.mapeamento_normas["1.1.1"],
+                    elemento=_trecho_elemento(img),
                     codigo_exemplo=f'<img src="{src}" alt="Descrição do conteúdo da imagem">'
-                ))
+                ), img)
         
         # Verificar inputs de imagem
-        inputs_img = self.soup.find_all('input', {'type': 'image'})
-        for inp in inputs_img:
-            if not inp.get('alt'):
-                self.problemas.append(ProblemaAcessibilidade(
-                    criterio="1.1.1 - Alternativas em Texto",
+        for inp in self._inputs:
+            if inp.name == 'input' and inp.get('type') == 'image' and not inp.get('alt'):
+                self._add_problema(problemas, _PROB_INPUT_IMAGEM_SEM_ALT(
                     descricao="Input tipo imagem sem atributo alt",
-                    severidade=SeveridadeProblema.CRITICO,
-                    nivel_wcag=NivelConformidade.A,
-                    elemento=str(inp)[:100],
-                    sugestao="Adicione alt descrevendo a ação do botão",
-                    referencia_wcag="WCAG 2.2 - 1.1.1",
-                    referencia_abnt=self.mapeamento_normas["1.1.1"],
-                    codigo_exemplo='<input type="image" alt="Enviar formulário">'
-                ))
+                    elemento=_trecho_elemento(inp)
+                ), inp)
+        
+        return problemas
     
-    def _verificar_estrutura_semantica(self):
+    def _verificar_estrutura_semantica(self) -> List[ProblemaAcessibilidade]:
         """
         WCAG 2.2 - 1.3.1 Informações e Relações (Nível A)
         ABNT NBR 17225:2025 - 5.3 Estrutura semântica
         """
-        # Verificar hierarquia de cabeçalhos
-        headings = self.soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
+        problemas = []
         
-        if not headings:
-            self.problemas.append(ProblemaAcessibilidade(
-                criterio="1.3.1 - Estrutura Semântica",
+        # Verificar hierarquia de cabeçalhos
+        if not self._headings:
+            problemas.append(_PROB_SEM_CABECALHOS(
                 descricao="Página sem cabeçalhos (h1-h6)",
-                severidade=SeveridadeProblema.GRAVE,
-                nivel_wcag=NivelConformidade.A,
-                elemento="<body>",
-                sugestao="Use cabeçalhos para estruturar o conteúdo",
-                referencia_wcag="WCAG 2.2 - 1.3.1",
-                referencia_abnt=self.mapeamento_normas["1.3.1"],
-                codigo_exemplo="<h1>Título Principal</h1>\n<h2>Seção</h2>"
+                elemento="<body>"
             ))
         
+        # Verificar saltos de nível (ex.: h2 seguido de h4)
+        niveis = self._niveis_cabecalho
+        for i in range(1, len(niveis)):
+            if niveis[i] - niveis[i - 1] > 1:
+                problemas.append(_PROB_SALTO_CABECALHO(
+                    descricao=f"Salto na hierarquia de cabeçalhos: h{niveis[i - 1]} seguido de h{niveis[i]}",
+                    elemento=_trecho_elemento(self._headings[i])
+                ))
+        
         # Verificar múltiplos H1
-        h1_count = len(self.soup.find_all('h1'))
+        h1_count = niveis.count(1)
         if h1_count > 1:
-            self.problemas.append(ProblemaAcessibilidade(
-                criterio="1.3.1 - Estrutura Semântica",
+            problemas.append(_PROB_MULTIPLOS_H1(
                 descricao=f"Múltiplos elementos H1 encontrados ({h1_count})",
-                severidade=SeveridadeProblema.MODERADO,
-                nivel_wcag=NivelConformidade.A,
-                elemento="<h1>",
-                sugestao="Use apenas um H1 por página como título principal",
-                referencia_wcag="WCAG 2.2 - 1.3.1",
-                referencia_abnt=self.mapeamento_normas["1.3.1"],
-                codigo_exemplo="<h1>Título único da página</h1>"
+                elemento="<h1>"
             ))
         
         # Verificar uso de landmarks HTML5
-        landmarks = ['header', 'nav', 'main', 'footer', 'aside', 'section']
-        found_landmarks = [tag for tag in landmarks if self.soup.find(tag)]
+        found_landmarks = _LANDMARKS_HTML5 & self._tag_set
         
         if len(found_landmarks) < 3:
-            self.problemas.append(ProblemaAcessibilidade(
-                criterio="1.3.1 - Estrutura Semântica",
+            problemas.append(_PROB_POUCOS_LANDMARKS(
                 descricao="Uso limitado de elementos HTML5 semânticos",
-                severidade=SeveridadeProblema.MODERADO,
-                nivel_wcag=NivelConformidade.A,
-                elemento="<body>",
-                sugestao="Use <header>, <nav>, <main>, <footer> para estruturar",
-                referencia_wcag="WCAG 2.2 - 1.3.1",
-                referencia_abnt=self.mapeamento_normas["1.3.1"],
-                codigo_exemplo="<header>...</header>\n<nav>...</nav>\n<main>...</main>"
+                elemento="<body>"
             ))
         
         # Verificar listas apropriadas
-        divs_como_listas = self.soup.find_all('div', class_=re.compile(r'list|item', re.I))
-        if len(divs_como_listas) > 3:
-            self.problemas.append(ProblemaAcessibilidade(
-                criterio="1.3.1 - Estrutura Semântica",
+        if len(self._divs_lista) > 3:
+            problemas.append(_PROB_DIVS_COMO_LISTAS(
                 descricao="Possível uso de divs em vez de listas semânticas",
-                severidade=SeveridadeProblema.LEVE,
-                nivel_wcag=NivelConformidade.A,
-                elemento="<div class='list/item'>",
-                sugestao="Use <ul>, <ol> e <li> para listas",
-                referencia_wcag="WCAG 2.2 - 1.3.1",
-                referencia_abnt=self.mapeamento_normas["1.3.1"],
-                codigo_exemplo="<ul>\n  <li>Item 1</li>\n  <li>Item 2</li>\n</ul>"
+                elemento="<div class='list/item'>"
             ))
+        
+        return problemas
     
-    def _verificar_contraste_cores(self):
+    def _verificar_contraste_cores(self) -> List[ProblemaAcessibilidade]:
         """
         WCAG 2.2 - 1.4.3 Contraste Mínimo (Nível AA)
         ABNT NBR 17225:2025 - 5.4.3 Contraste de cores
         """
-        # Verificar estilos inline e CSS
-        elementos_com_estilo = self.soup.find_all(style=True)
+        problemas = []
         
-        for elem in elementos_com_estilo:
+        # Verificar estilos inline e CSS
+        for elem in self._styled:
             style = elem.get('style', '')
             # Extrair cores do estilo
-            cores = re.findall(r'color:\s*([^;]+)', style)
-            bg_cores = re.findall(r'background(?:-color)?:\s*([^;]+)', style)
+            cor = fundo = None
+            for propriedade, valor in _RE_DECLARACAO_COR.findall(style):
+                if propriedade == 'color':
+                    cor = valor
+                else:
+                    fundo = valor
+            
+            if not (cor and fundo):
+                continue
             
-            if cores and bg_cores:
-                # Aviso genérico sobre verificação de contraste
-                self.problemas.append(ProblemaAcessibilidade(
-                    criterio="1.4.3 - Contraste de Cores",
+            rgb_cor, rgb_fundo = _extrair_cor(cor), _extrair_cor(fundo)
+            if rgb_cor is None or rgb_fundo is None:
+                # Cores não determináveis: aviso genérico sobre verificação de contraste
+                self._add_problema(problemas, _PROB_CONTRASTE(
                     descricao="Verifique contraste entre texto e fundo",
-                    severidade=SeveridadeProblema.MODERADO,
-                    nivel_wcag=NivelConformidade.AA,
-                    elemento=str(elem)[:100],
-                    sugestao="Razão de contraste mínima: 4.5:1 para texto normal, 3:1 para texto grande",
-                    referencia_wcag="WCAG 2.2 - 1.4.3",
-                    referencia_abnt=self.mapeamento_normas["1.4.3"],
-                    codigo_exemplo="Use ferramentas como WebAIM Contrast Checker"
-                ))
+                    elemento=_trecho_elemento(elem)
+                ), elem)
+                continue
+            
+            razao = _razao_contraste(rgb_cor, rgb_fundo)
+            if razao < 4.5:
+                self._add_problema(problemas, _PROB_CONTRASTE_INSUFICIENTE(
+                    descricao=f"Contraste insuficiente entre texto e fundo ({razao:.2f}:1)",
+                    elemento=_trecho_elemento(elem)
+                ), elem)
+        
+        return problemas
     
-    def _verificar_navegacao_teclado(self):
+    def _verificar_navegacao_teclado(self) -> List[ProblemaAcessibilidade]:
         """
         WCAG 2.2 - 2.1.1 Teclado (Nível A)
         ABNT NBR 17225:2025 - 6.1 Acessibilidade por teclado
         """
-        # Verificar elementos interativos sem tabindex adequado
-        elementos_interativos = self.soup.find_all(['div', 'span'], 
-                                                   onclick=True)
+        problemas = []
         
-        for elem in elementos_interativos:
+        # Verificar elementos interativos sem tabindex adequado
+        for elem in self._interativos:
             tabindex = elem.get('tabindex')
             role = elem.get('role')
             
-            if tabindex is None and role not in ['button', 'link']:
-                self.problemas.append(ProblemaAcessibilidade(
-                    criterio="2.1.1 - Navegação por Teclado",
+            if tabindex is None and role not in _ROLES_TECLADO:
+                self._add_problema(problemas, _PROB_INTERATIVO_SEM_TECLADO(
                     descricao="Elemento interativo não acessível por teclado",
-                    severidade=SeveridadeProblema.CRITICO,
-                    nivel_wcag=NivelConformidade.A,
-                    elemento=str(elem)[:100],
-                    sugestao="Use elementos nativos (<button>, <a>) ou adicione tabindex='0' e role apropriado",
-                    referencia_wcag="WCAG 2.2 - 2.1.1",
-                    referencia_abnt=self.mapeamento_normas["2.1.1"],
-                    codigo_exemplo='<div role="button" tabindex="0" onkeypress="...">Clique</div>'
-                ))
+                    elemento=_trecho_elemento(elem)
+                ), elem)
         
         # Verificar skip links
-        skip_links = self.soup.find_all('a', href=re.compile(r'^#'))
+        skip_links = [a for a in self._links if _RE_LINK_SALTO.search(a['href'])]
         if not skip_links:
-            self.problemas.append(ProblemaAcessibilidade(
-                criterio="2.4.1 - Bypass de Blocos",
+            problemas.append(_PROB_SEM_SKIP_LINKS(
                 descricao="Ausência de links para pular navegação (skip links)",
-                severidade=SeveridadeProblema.GRAVE,
-                nivel_wcag=NivelConformidade.A,
-                elemento="<body>",
-                sugestao="Adicione link 'Pular para conteúdo principal' no início da página",
-                referencia_wcag="WCAG 2.2 - 2.4.1",
-                referencia_abnt=self.mapeamento_normas["2.4.1"],
-                codigo_exemplo='<a href="#main-content" class="skip-link">Pular para conteúdo</a>'
+                elemento="<body>"
             ))
+        
+        return problemas
     
-    def _verificar_formularios(self):
+    def _verificar_formularios(self) -> List[ProblemaAcessibilidade]:
         """
         WCAG 2.2 - 4.1.2 Nome, Função e Valor (Nível A)
         ABNT NBR 17225:2025 - 8.2 Identificação de campos
         """
-        # Verificar inputs sem labels
-        inputs = self.soup.find_all(['input', 'select', 'textarea'])
+        problemas = []
         
-        for inp in inputs:
+        # Verificar inputs sem labels
+        for inp in self._inputs:
             input_type = inp.get('type', 'text')
-            if input_type in ['hidden', 'submit', 'button', 'image']:
+            if input_type in _TIPOS_INPUT_SEM_LABEL:
                 continue
             
             input_id = inp.get('id')
@@ -331,372 +1380,290 @@ class AgenteAcessibilidade:
             aria_labelledby = inp.get('aria-labelledby')
             title = inp.get('title')
             
-            # Procurar label associado
-            label_encontrado = False
-            if input_id:
-                label = self.soup.find('label', {'for': input_id})
-                if label:
-                    label_encontrado = True
-            
-            # Verificar se está dentro de um label
-            if inp.find_parent('label'):
-                label_encontrado = True
+            # Procurar label associado (via for=) ou label envolvendo o campo
+            label_encontrado = (
+                id(inp) in self._inputs_em_label
+                or (input_id is not None and input_id in self._label_for_ids)
+            )
             
             if not (label_encontrado or aria_label or aria_labelledby or title):
-                self.problemas.append(ProblemaAcessibilidade(
-                    criterio="4.1.2 - Nome, Função e Valor",
+                self._add_problema(problemas, _PROB_CAMPO_SEM_LABEL(
                     descricao=f"Campo de formulário sem label: {input_type}",
-                    severidade=SeveridadeProblema.CRITICO,
-                    nivel_wcag=NivelConformidade.A,
-                    elemento=str(inp)[:100],
-                    sugestao="Associe um <label> ao campo ou use aria-label",
-                    referencia_wcag="WCAG 2.2 - 4.1.2",
-                    referencia_abnt=self.mapeamento_normas["4.1.2"],
-                    codigo_exemplo='<label for="nome">Nome:</label>\n<input type="text" id="nome">'
-                ))
+                    elemento=_trecho_elemento(inp)
+                ), inp)
         
         # Verificar campos obrigatórios
-        required_inputs = self.soup.find_all(['input', 'select', 'textarea'], required=True)
+        required_inputs = [inp for inp in self._inputs if inp.has_attr('required')]
         for inp in required_inputs:
             aria_required = inp.get('aria-required')
             if aria_required != 'true':
-                self.problemas.append(ProblemaAcessibilidade(
-                    criterio="4.1.2 - Nome, Função e Valor",
+                self._add_problema(problemas, _PROB_OBRIGATORIO_SEM_ARIA(
                     descricao="Campo obrigatório sem aria-required='true'",
-                    severidade=SeveridadeProblema.LEVE,
-                    nivel_wcag=NivelConformidade.A,
-                    elemento=str(inp)[:100],
-                    sugestao="Adicione aria-required='true' para leitores de tela",
-                    referencia_wcag="WCAG 2.2 - 4.1.2",
-                    referencia_abnt=self.mapeamento_normas["4.1.2"],
-                    codigo_exemplo='<input type="text" required aria-required="true">'
-                ))
+                    elemento=_trecho_elemento(inp)
+                ), inp)
+        
+        return problemas
     
-    def _verificar_multimedia(self):
+    def _verificar_multimedia(self) -> List[ProblemaAcessibilidade]:
         """
         WCAG 2.2 - 1.2 Multimídia Baseada em Tempo
         ABNT NBR 17225:2025 - 5.2 Alternativas para multimídia
         """
-        # Verificar vídeos
-        videos = self.soup.find_all(['video', 'iframe'])
+        problemas = []
         
-        for video in videos:
+        # Verificar vídeos
+        for video in self._videos:
             if video.name == 'video':
                 # Verificar legendas/tracks
-                tracks = video.find_all('track', kind='captions')
-                if not tracks:
-                    self.problemas.append(ProblemaAcessibilidade(
-                        criterio="1.2.2 - Legendas",
+                if not video.find('track', kind='captions'):
+                    self._add_problema(problemas, _PROB_VIDEO_SEM_LEGENDAS(
                         descricao="Vídeo sem legendas/closed captions",
-                        severidade=SeveridadeProblema.CRITICO,
-                        nivel_wcag=NivelConformidade.A,
-                        elemento=str(video)[:100],
-                        sugestao="Adicione <track kind='captions'> com legendas",
-                        referencia_wcag="WCAG 2.2 - 1.2.2",
-                        referencia_abnt="ABNT 5.2.2 - Legendas sincronizadas",
-                        codigo_exemplo='<video>\n  <track kind="captions" src="legendas.vtt" srclang="pt-BR">\n</video>'
-                    ))
+                        elemento=_trecho_elemento(video)
+                    ), video)
                 
                 # Verificar autoplay
                 if video.get('autoplay'):
-                    self.problemas.append(ProblemaAcessibilidade(
-                        criterio="1.4.2 - Controle de Áudio",
+                    self._add_problema(problemas, _PROB_VIDEO_AUTOPLAY(
                         descricao="Vídeo com autoplay pode causar distração",
-                        severidade=SeveridadeProblema.GRAVE,
-                        nivel_wcag=NivelConformidade.A,
-                        elemento=str(video)[:100],
-                        sugestao="Remova autoplay ou forneça controle de pausa",
-                        referencia_wcag="WCAG 2.2 - 1.4.2",
-                        referencia_abnt="ABNT 5.4.2 - Controle de reprodução",
-                        codigo_exemplo='<video controls>\n  <!-- sem autoplay -->\n</video>'
-                    ))
+                        elemento=_trecho_elemento(video)
+                    ), video)
         
         # Verificar áudios
-        audios = self.soup.find_all('audio')
-        for audio in audios:
+        for audio in self._audios:
             if audio.get('autoplay'):
-                self.problemas.append(ProblemaAcessibilidade(
-                    criterio="1.4.2 - Controle de Áudio",
+                self._add_problema(problemas, _PROB_AUDIO_AUTOPLAY(
                     descricao="Áudio com autoplay",
-                    severidade=SeveridadeProblema.GRAVE,
-                    nivel_wcag=NivelConformidade.A,
-                    elemento=str(audio)[:100],
-                    sugestao="Remova autoplay de elementos de áudio",
-                    referencia_wcag="WCAG 2.2 - 1.4.2",
-                    referencia_abnt="ABNT 5.4.2 - Controle de reprodução",
-                    codigo_exemplo='<audio controls src="audio.mp3"></audio>'
-                ))
+                    elemento=_trecho_elemento(audio)
+                ), audio)
+        
+        return problemas
     
-    def _verificar_titulos_pagina(self):
+    def _verificar_titulos_pagina(self) -> List[ProblemaAcessibilidade]:
         """
         WCAG 2.2 - 2.4.2 Título da Página (Nível A)
         ABNT NBR 17225:2025 - 6.4.2 Títulos descritivos
         """
-        title = self.soup.find('title')
+        problemas = []
+        
+        title = self._title
         
         if not title:
-            self.problemas.append(ProblemaAcessibilidade(
-                criterio="2.4.2 - Título da Página",
+            problemas.append(_PROB_SEM_TITULO(
                 descricao="Página sem elemento <title>",
-                severidade=SeveridadeProblema.CRITICO,
-                nivel_wcag=NivelConformidade.A,
-                elemento="<head>",
-                sugestao="Adicione <title> descritivo no <head>",
-                referencia_wcag="WCAG 2.2 - 2.4.2",
-                referencia_abnt=self.mapeamento_normas["2.4.2"],
-                codigo_exemplo='<head>\n  <title>Nome da Página - Nome do Site</title>\n</head>'
+                elemento="<head>"
             ))
         elif len(title.get_text().strip()) < 3:
-            self.problemas.append(ProblemaAcessibilidade(
-                criterio="2.4.2 - Título da Página",
+            self._add_problema(problemas, _PROB_TITULO_CURTO(
                 descricao="Título da página muito curto ou vazio",
-                severidade=SeveridadeProblema.GRAVE,
-                nivel_wcag=NivelConformidade.A,
-                elemento=str(title),
-                sugestao="Forneça título descritivo e significativo",
-                referencia_wcag="WCAG 2.2 - 2.4.2",
-                referencia_abnt=self.mapeamento_normas["2.4.2"],
-                codigo_exemplo='<title>Página Inicial - Minha Empresa</title>'
-            ))
+                elemento=_trecho_elemento(title)
+            ), title)
+        
+        return problemas
     
-    def _verificar_idioma(self):
+    def _verificar_idioma(self) -> List[ProblemaAcessibilidade]:
         """
         WCAG 2.2 - 3.1.1 Idioma da Página (Nível A)
         ABNT NBR 17225:2025 - 7.1 Identificação do idioma
         """
-        html = self.soup.find('html')
+        problemas = []
+        
+        html = self._html
         
         if not html or not html.get('lang'):
-            self.problemas.append(ProblemaAcessibilidade(
-                criterio="3.1.1 - Idioma da Página",
+            problemas.append(_PROB_SEM_IDIOMA(
                 descricao="Atributo lang ausente no elemento <html>",
-                severidade=SeveridadeProblema.CRITICO,
-                nivel_wcag=NivelConformidade.A,
-                elemento="<html>",
-                sugestao="Adicione atributo lang no elemento html",
-                referencia_wcag="WCAG 2.2 - 3.1.1",
-                referencia_abnt=self.mapeamento_normas["3.1.1"],
-                codigo_exemplo='<html lang="pt-BR">'
+                elemento="<html>"
             ))
+        
+        return problemas
     
-    def _verificar_links(self):
+    def _verificar_links(self) -> List[ProblemaAcessibilidade]:
         """
         WCAG 2.2 - 2.4.4 Finalidade do Link (Nível A)
         ABNT NBR 17225:2025 - 6.4.4 Links descritivos
         """
-        links = self.soup.find_all('a', href=True)
+        problemas = []
         
-        for link in links:
+        for link in self._links:
             texto = link.get_text().strip()
             aria_label = link.get('aria-label')
             title = link.get('title')
             
             # Links vazios
             if not texto and not aria_label and not link.find('img'):
-                self.problemas.append(ProblemaAcessibilidade(
-                    criterio="2.4.4 - Finalidade do Link",
+                self._add_problema(problemas, _PROB_LINK_VAZIO(
                     descricao="Link sem texto ou descrição",
-                    severidade=SeveridadeProblema.CRITICO,
-                    nivel_wcag=NivelConformidade.A,
-                    elemento=str(link)[:100],
-                    sugestao="Adicione texto descritivo ou aria-label",
-                    referencia_wcag="WCAG 2.2 - 2.4.4",
-                    referencia_abnt="ABNT 6.4.4 - Propósito dos links",
-                    codigo_exemplo='<a href="/sobre" aria-label="Sobre nossa empresa">Saiba mais</a>'
-                ))
+                    elemento=_trecho_elemento(link)
+                ), link)
             
-            # Links genéricos
-            textos_genericos = ['clique aqui', 'saiba mais', 'leia mais', 'aqui', 'mais']
-            if texto.lower() in textos_genericos and not aria_label:
-                self.problemas.append(ProblemaAcessibilidade(
-                    criterio="2.4.4 - Finalidade do Link",
+            # Links genéricos (espaços colapsados e pontuação final ignorada)
+            texto_minusculo = texto.lower()
+            texto_normalizado = _normalizar_texto_link(texto_minusculo)
+            if texto_normalizado in _TEXTOS_LINK_GENERICOS and not aria_label:
+                self._add_problema(problemas, _PROB_LINK_GENERICO(
                     descricao=f"Link com texto genérico: '{texto}'",
-                    severidade=SeveridadeProblema.MODERADO,
-                    nivel_wcag=NivelConformidade.A,
-                    elemento=str(link)[:100],
-                    sugestao="Use texto descritivo do destino do link",
-                    referencia_wcag="WCAG 2.2 - 2.4.4",
-                    referencia_abnt="ABNT 6.4.4 - Propósito dos links",
-                    codigo_exemplo='<a href="/servicos">Conheça nossos serviços</a>'
-                ))
+                    elemento=_trecho_elemento(link)
+                ), link)
             
             # Links que abrem em nova janela
             target = link.get('target')
             if target == '_blank':
-                aviso_nova_janela = 'nova janela' in texto.lower() or 'new window' in texto.lower()
+                aviso_nova_janela = 'nova janela' in texto_minusculo or 'new window' in texto_minusculo
                 if not aviso_nova_janela and not aria_label:
-                    self.problemas.append(ProblemaAcessibilidade(
-                        criterio="3.2.5 - Mudança de Contexto",
+                    self._add_problema(problemas, _PROB_LINK_NOVA_JANELA(
                         descricao="Link abre em nova janela sem aviso",
-                        severidade=SeveridadeProblema.LEVE,
-                        nivel_wcag=NivelConformidade.AAA,
-                        elemento=str(link)[:100],
-                        sugestao="Avise que o link abre em nova janela",
-                        referencia_wcag="WCAG 2.2 - 3.2.5",
-                        referencia_abnt="ABNT 7.2 - Previsibilidade",
-                        codigo_exemplo='<a href="..." target="_blank" rel="noopener">Link (abre em nova janela)</a>'
-                    ))
+                        elemento=_trecho_elemento(link)
+                    ), link)
+        
+        return problemas
     
-    def _verificar_tabelas(self):
+    def _verificar_tabelas(self) -> List[ProblemaAcessibilidade]:
         """
         WCAG 2.2 - 1.3.1 Info e Relações (Tabelas)
         ABNT NBR 17225:2025 - 5.3.1 Estrutura de tabelas
         """
-        tabelas = self.soup.find_all('table')
+        problemas = []
         
-        for tabela in tabelas:
+        for tabela in self._tables:
             # Verificar caption
             caption = tabela.find('caption')
             if not caption:
-                self.problemas.append(ProblemaAcessibilidade(
-                    criterio="1.3.1 - Estrutura de Tabelas",
+                self._add_problema(problemas, _PROB_TABELA_SEM_CAPTION(
                     descricao="Tabela sem <caption>",
-                    severidade=SeveridadeProblema.MODERADO,
-                    nivel_wcag=NivelConformidade.A,
-                    elemento=str(tabela)[:100],
-                    sugestao="Adicione <caption> descrevendo o propósito da tabela",
-                    referencia_wcag="WCAG 2.2 - 1.3.1",
-                    referencia_abnt=self.mapeamento_normas["1.3.1"],
-                    codigo_exemplo='<table>\n  <caption>Vendas por região em 2024</caption>\n  ...\n</table>'
-                ))
+                    elemento=_trecho_elemento(tabela)
+                ), tabela)
             
-            # Verificar cabeçalhos
-            thead = tabela.find('thead')
+            # Verificar cabeçalhos (<thead> só é procurado se não houver <th>)
             th_elements = tabela.find_all('th')
             
-            if not thead and not th_elements:
-                self.problemas.append(ProblemaAcessibilidade(
-                    criterio="1.3.1 - Estrutura de Tabelas",
+            if not th_elements and not tabela.find('thead'):
+                self._add_problema(problemas, _PROB_TABELA_SEM_TH(
                     descricao="Tabela sem elementos <th> para cabeçalhos",
-                    severidade=SeveridadeProblema.GRAVE,
-                    nivel_wcag=NivelConformidade.A,
-                    elemento=str(tabela)[:100],
-                    sugestao="Use <th> para células de cabeçalho e <thead> para agrupar",
-                    referencia_wcag="WCAG 2.2 - 1.3.1",
-                    referencia_abnt=self.mapeamento_normas["1.3.1"],
-                    codigo_exemplo='<table>\n  <thead>\n    <tr><th>Coluna 1</th><th>Coluna 2</th></tr>\n  </thead>\n  <tbody>...</tbody>\n</table>'
-                ))
+                    elemento=_trecho_elemento(tabela)
+                ), tabela)
             
             # Verificar scope em th
             for th in th_elements:
                 if not th.get('scope'):
-                    self.problemas.append(ProblemaAcessibilidade(
-                        criterio="1.3.1 - Estrutura de Tabelas",
+                    self._add_problema(problemas, _PROB_TH_SEM_SCOPE(
                         descricao="Elemento <th> sem atributo scope",
-                        severidade=SeveridadeProblema.LEVE,
-                        nivel_wcag=NivelConformidade.A,
-                        elemento=str(th)[:100],
-                        sugestao="Adicione scope='col' ou scope='row' ao <th>",
-                        referencia_wcag="WCAG 2.2 - 1.3.1",
-                        referencia_abnt=self.mapeamento_normas["1.3.1"],
-                        codigo_exemplo='<th scope="col">Nome da Coluna</th>'
-                    ))
+                        elemento=_trecho_elemento(th)
+                    ), th)
+        
+        return problemas
     
-    def _verificar_aria(self):
+    def _verificar_aria(self) -> List[ProblemaAcessibilidade]:
         """
         WCAG 2.2 - 4.1.2 Nome, Função e Valor (ARIA)
         ABNT NBR 17225:2025 - 8.2 ARIA e tecnologias assistivas
         """
+        problemas = []
+        
         # Verificar roles ARIA
-        elementos_com_role = self.soup.find_all(attrs={"role": True})
-        
-        roles_validos = [
-            'alert', 'alertdialog', 'application', 'article', 'banner', 
-            'button', 'checkbox', 'complementary', 'contentinfo', 'dialog',
-            'directory', 'document', 'form', 'grid', 'gridcell', 'group',
-            'heading', 'img', 'link', 'list', 'listbox', 'listitem',
-            'log', 'main', 'marquee', 'math', 'menu', 'menubar', 'menuitem',
-            'menuitemcheckbox', 'menuitemradio', 'navigation', 'note',
-            'option', 'presentation', 'progressbar', 'radio', 'radiogroup',
-            'region', 'row', 'rowgroup', 'rowheader', 'scrollbar', 'search',
-            'separator', 'slider', 'spinbutton', 'status', 'tab', 'tablist',
-            'tabpanel', 'textbox', 'timer', 'toolbar', 'tooltip', 'tree',
-            'treegrid', 'treeitem'
-        ]
-        
-        for elem in elementos_com_role:
+        for elem in self._roled:
             role = elem.get('role')
-            if role not in roles_validos:
-                self.problemas.append(ProblemaAcessibilidade(
-                    criterio="4.1.2 - ARIA Válido",
+            if role not in _ROLES_ARIA_VALIDOS:
+                self._add_problema(problemas, _PROB_ROLE_INVALIDO(
                     descricao=f"Role ARIA inválido: '{role}'",
-                    severidade=SeveridadeProblema.GRAVE,
-                    nivel_wcag=NivelConformidade.A,
-                    elemento=str(elem)[:100],
-                    sugestao="Use apenas roles ARIA válidos da especificação",
-                    referencia_wcag="WCAG 2.2 - 4.1.2",
-                    referencia_abnt=self.mapeamento_normas["4.1.2"],
-                    codigo_exemplo='<div role="navigation">...</div>'
-                ))
+                    elemento=_trecho_elemento(elem)
+                ), elem)
         
         # Verificar aria-labelledby referenciando IDs inexistentes
-        elementos_com_labelledby = self.soup.find_all(attrs={"aria-labelledby": True})
-        for elem in elementos_com_labelledby:
-            labelledby_ids = elem.get('aria-labelledby').split()
-            for id_ref in labelledby_ids:
-                if not self.soup.find(id=id_ref):
-                    self.problemas.append(ProblemaAcessibilidade(
-                        criterio="4.1.2 - ARIA Referências",
+        for elem in self._labelledby:
+            for id_ref in elem['aria-labelledby'].split():
+                if id_ref not in self._id_set:
+                    self._add_problema(problemas, _PROB_LABELLEDBY_INEXISTENTE(
                         descricao=f"aria-labelledby referencia ID inexistente: '{id_ref}'",
-                        severidade=SeveridadeProblema.GRAVE,
-                        nivel_wcag=NivelConformidade.A,
-                        elemento=str(elem)[:100],
-                        sugestao="Certifique-se que o ID referenciado existe na página",
-                        referencia_wcag="WCAG 2.2 - 4.1.2",
-                        referencia_abnt=self.mapeamento_normas["4.1.2"],
-                        codigo_exemplo='<h2 id="titulo-secao">Título</h2>\n<div aria-labelledby="titulo-secao">...</div>'
-                    ))
+                        elemento=_trecho_elemento(elem)
+                    ), elem)
+        
+        return problemas
     
-    def _verificar_responsividade(self):
+    def _verificar_responsividade(self) -> List[ProblemaAcessibilidade]:
         """
         WCAG 2.2 - 1.4.10 Reflow (Nível AA)
         ABNT NBR 17225:2025 - 5.4.10 Adaptação de conteúdo
         """
+        problemas = []
+        
         # Verificar viewport meta tag
-        viewport = self.soup.find('meta', attrs={'name': 'viewport'})
+        viewport = self._viewport
         
         if not viewport:
-            self.problemas.append(ProblemaAcessibilidade(
-                criterio="1.4.10 - Reflow/Responsividade",
+            problemas.append(_PROB_SEM_VIEWPORT(
                 descricao="Meta tag viewport ausente",
-                severidade=SeveridadeProblema.GRAVE,
-                nivel_wcag=NivelConformidade.AA,
-                elemento="<head>",
-                sugestao="Adicione meta viewport para responsividade",
-                referencia_wcag="WCAG 2.2 - 1.4.10",
-                referencia_abnt="ABNT 5.4.10 - Adaptação visual",
-                codigo_exemplo='<meta name="viewport" content="width=device-width, initial-scale=1.0">'
+                elemento="<head>"
             ))
         else:
-            content = viewport.get('content', '')
-            if 'user-scalable=no' in content or 'maximum-scale=1' in content:
-                self.problemas.append(ProblemaAcessibilidade(
-                    criterio="1.4.4 - Redimensionamento de Texto",
+            diretivas = _parse_viewport(viewport.get('content', ''))
+            try:
+                escala_maxima = float(diretivas.get('maximum-scale', 'inf'))
+            except ValueError:
+                escala_maxima = float('inf')
+            if diretivas.get('user-scalable') in _VALORES_SEM_ZOOM or escala_maxima <= 1:
+                self._add_problema(problemas, _PROB_ZOOM_BLOQUEADO(
                     descricao="Viewport bloqueia zoom do usuário",
-                    severidade=SeveridadeProblema.CRITICO,
-                    nivel_wcag=NivelConformidade.AA,
-                    elemento=str(viewport),
-                    sugestao="Não bloqueie o zoom: remova user-scalable=no",
-                    referencia_wcag="WCAG 2.2 - 1.4.4",
-                    referencia_abnt="ABNT 5.4.4 - Redimensionamento",
-                    codigo_exemplo='<meta name="viewport" content="width=device-width, initial-scale=1.0">'
-                ))
+                    elemento=_trecho_elemento(viewport)
+                ), viewport)
+        
+        return problemas
+    
+    def _add_problema(self, problemas: List[ProblemaAcessibilidade],
+                      problema: ProblemaAcessibilidade, origem) -> None:
+        """
+        Acrescenta a `problemas` um problema apontado no elemento `origem`,
+        descartando repetições do mesmo achado no mesmo elemento (ex.: um
+        <th> de tabela aninhada visto também pela tabela externa).
+        
+        O conjunto é compartilhado entre as verificações em paralelo, mas
+        cada critério é produzido por uma única verificação, então chaves
+        iguais nunca são disputadas por threads diferentes.
+        """
+        chave = (problema.criterio, problema.descricao, id(origem))
+        if chave not in self._vistos:
+            self._vistos.add(chave)
+            problemas.append(problema)
     
     def _is_decorative(self, img) -> bool:
         """Verifica se uma imagem é decorativa"""
-        # Imagens dentro de links com texto
-        parent_link = img.find_parent('a')
-        if parent_link and parent_link.get_text().strip():
+        # Imagens dentro de links com texto (subida direta pelos pais, sem
+        # o casamento genérico de find_parent)
+        parent_link = img.parent
+        while parent_link is not None and parent_link.name != 'a':
+            parent_link = parent_link.parent
+        if parent_link is not None and parent_link.get_text().strip():
             return True
         
         # Classes ou atributos que indicam decoração
-        classes = ' '.join(img.get('class', []))
-        if any(word in classes.lower() for word in ['icon', 'decor', 'bg', 'background']):
+        if any(_RE_CLASSE_DECORATIVA.search(c) for c in img.get('class') or ()):
             return True
         
         return False
     
-    def _calcular_pontuacao(self) -> float:
+    def _indexar_problemas(self) -> IndiceProblemas:
+        """
+        Acumula as contagens por severidade, nível WCAG, categoria e
+        referência ABNT usadas no relatório, a partir das colunas compactas
+        preenchidas ao registrar os problemas
+        """
+        colunas = self._colunas
+        indice = IndiceProblemas()
+        
+        for severidade in SeveridadeProblema:
+            quantidade = colunas.severidades.count(severidade.ordem)
+            if quantidade:
+                indice.severidade_counts[severidade] = quantidade
+        for nivel in NivelConformidade:
+            quantidade = colunas.niveis.count(nivel.ordem)
+            if quantidade:
+                indice.nivel_counts[nivel] = quantidade
+        for categoria, id_categoria in colunas.ids_categorias.items():
+            indice.categoria_counts[categoria] = colunas.categorias.count(id_categoria)
+        indice.abnt_violados.update(colunas.secoes_abnt.values())
+        
+        return indice
+    
+    def _calcular_pontuacao(self, indice: IndiceProblemas) -> float:
         """
         Calcula pontuação de acessibilidade (0-100)
         Baseado na severidade e quantidade de problemas
@@ -704,56 +1671,46 @@ class AgenteAcessibilidade:
         if not self.problemas:
             return 100.0
         
-        pesos_severidade = {
-            SeveridadeProblema.CRITICO: 10,
-            SeveridadeProblema.GRAVE: 5,
-            SeveridadeProblema.MODERADO: 2,
-            SeveridadeProblema.LEVE: 1
-        }
-        
         pontos_perdidos = sum(
-            pesos_severidade[p.severidade] for p in self.problemas
+            severidade.peso * quantidade
+            for severidade, quantidade in indice.severidade_counts.items()
         )
         
         # Normalizar para escala 0-100
         pontuacao = max(0, 100 - pontos_perdidos)
         return round(pontuacao, 2)
     
-    def _gerar_recomendacoes_priorizadas(self) -> List[str]:
+    def _gerar_recomendacoes_priorizadas(self, indice: IndiceProblemas) -> List[str]:
         """Gera lista de recomendações priorizadas"""
         recomendacoes = []
         
         # Agrupar por severidade
-        criticos = [p for p in self.problemas if p.severidade == SeveridadeProblema.CRITICO]
-        graves = [p for p in self.problemas if p.severidade == SeveridadeProblema.GRAVE]
+        criticos = indice.severidade_counts.get(SeveridadeProblema.CRITICO, 0)
+        graves = indice.severidade_counts.get(SeveridadeProblema.GRAVE, 0)
         
         if criticos:
             recomendacoes.append(
-                f"PRIORIDADE CRÍTICA: Corrigir {len(criticos)} problemas críticos "
+                f"PRIORIDADE CRÍTICA: Corrigir {criticos} problemas críticos "
                 "(imagens sem alt, formulários sem labels, elementos não acessíveis por teclado)"
             )
         
         if graves:
             recomendacoes.append(
-                f"PRIORIDADE ALTA: Resolver {len(graves)} problemas graves "
+                f"PRIORIDADE ALTA: Resolver {graves} problemas graves "
                 "(estrutura semântica, contraste, navegação)"
             )
         
         # Recomendações por categoria
-        categorias = {}
-        for p in self.problemas:
-            cat = p.criterio.split('-')[0].strip()
-            categorias[cat] = categorias.get(cat, 0) + 1
-        
-        categoria_mais_problemas = max(categorias.items(), key=lambda x: x[1]) if categorias else None
-        if categoria_mais_problemas:
+        categorias = indice.categoria_counts
+        # most_common(1) é vazio quando não há problemas
+        for categoria, ocorrencias in categorias.most_common(1):
             recomendacoes.append(
-                f"Categoria com mais problemas: '{categoria_mais_problemas[0]}' "
-                f"({categoria_mais_problemas[1]} ocorrências)"
+                f"Categoria com mais problemas: '{categoria}' "
+                f"({ocorrencias} ocorrências)"
             )
         
         # Conformidade
-        nivel_a = sum(1 for p in self.problemas if p.nivel_wcag == NivelConformidade.A)
+        nivel_a = indice.nivel_counts.get(NivelConformidade.A, 0)
         if nivel_a > 0:
             recomendacoes.append(
                 f"{nivel_a} violações do Nível A da WCAG (requisitos mínimos obrigatórios)"
@@ -765,15 +1722,16 @@ class AgenteAcessibilidade:
         
         return recomendacoes
     
-    def _avaliar_conformidade(self) -> Tuple[Dict[str, bool], Dict[str, bool]]:
+    def _avaliar_conformidade(self, indice: IndiceProblemas
+                              ) -> Tuple[Dict[str, bool], Dict[str, bool]]:
         """Avalia conformidade com WCAG e ABNT"""
         # WCAG
-        problemas_nivel_a = [p for p in self.problemas if p.nivel_wcag == NivelConformidade.A]
-        problemas_nivel_aa = [p for p in self.problemas if p.nivel_wcag == NivelConformidade.AA]
+        problemas_nivel_a = indice.nivel_counts.get(NivelConformidade.A, 0)
+        problemas_nivel_aa = indice.nivel_counts.get(NivelConformidade.AA, 0)
         
         conformidade_wcag = {
-            'Nível A': len(problemas_nivel_a) == 0,
-            'Nível AA': len(problemas_nivel_a) == 0 and len(problemas_nivel_aa) == 0,
+            'Nível A': problemas_nivel_a == 0,
+            'Nível AA': problemas_nivel_a == 0 and problemas_nivel_aa == 0,
             'Nível AAA': False  # Requer análise mais profunda
         }
         
@@ -785,33 +1743,36 @@ class AgenteAcessibilidade:
             '8.2 - Identificação de campos': True
         }
         
-        for problema in self.problemas:
-            if problema.referencia_abnt:
-                criterio_base = problema.referencia_abnt.split('-')[0].strip()
-                if any(criterio_base in key for key in criterios_abnt.keys()):
-                    for key in criterios_abnt.keys():
-                        if criterio_base in key:
-                            criterios_abnt[key] = False
+        # Seção ("5.1") -> critério; cada seção violada é uma consulta O(1)
+        secoes = {key.partition('-')[0].strip(): key for key in criterios_abnt}
+        violados = 0
+        for secao in indice.abnt_violados:
+            key = secoes.get(secao)
+            if key is not None:
+                criterios_abnt[key] = False
+                violados += 1
+                if violados == len(criterios_abnt):
+                    break
         
         return conformidade_wcag, criterios_abnt
     
     def _gerar_relatorio(self) -> RelatorioAcessibilidade:
         """Gera relatório completo de acessibilidade"""
-        pontuacao = self._calcular_pontuacao()
+        indice = self._indexar_problemas()
+        pontuacao = self._calcular_pontuacao(indice)
         
+        severidades = indice.severidade_counts
         problemas_por_severidade = {
-            'Crítico': sum(1 for p in self.problemas if p.severidade == SeveridadeProblema.CRITICO),
-            'Grave': sum(1 for p in self.problemas if p.severidade == SeveridadeProblema.GRAVE),
-            'Moderado': sum(1 for p in self.problemas if p.severidade == SeveridadeProblema.MODERADO),
-            'Leve': sum(1 for p in self.problemas if p.severidade == SeveridadeProblema.LEVE)
+            rotulo: severidades.get(severidade, 0)
+            for severidade, rotulo in _ROTULOS_SEVERIDADE
         }
         
-        conformidade_wcag, conformidade_abnt = self._avaliar_conformidade()
-        recomendacoes = self._gerar_recomendacoes_priorizadas()
+        conformidade_wcag, conformidade_abnt = self._avaliar_conformidade(indice)
+        recomendacoes = self._gerar_recomendacoes_priorizadas(indice)
         
         return RelatorioAcessibilidade(
             url=self.url,
-            data_avaliacao=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            data_avaliacao=_data_atual(),
             pontuacao_geral=pontuacao,
             total_problemas=len(self.problemas),
             problemas_por_severidade=problemas_por_severidade,
@@ -825,7 +1786,7 @@ class AgenteAcessibilidade:
         """Gera relatório em caso de erro"""
         return RelatorioAcessibilidade(
             url=self.url,
-            data_avaliacao=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            data_avaliacao=_data_atual(),
             pontuacao_geral=0.0,
             total_problemas=0,
             problemas_por_severidade={},
@@ -836,45 +1797,58 @@ class AgenteAcessibilidade:
         )
     
     def exportar_relatorio_json(self, relatorio: RelatorioAcessibilidade, 
-                                arquivo: str = "relatorio_acessibilidade.json"):
-        """Exporta relatório em formato JSON"""
-        dados = {
-            'url': relatorio.url,
-            'data_avaliacao': relatorio.data_avaliacao,
-            'pontuacao_geral': relatorio.pontuacao_geral,
-            'total_problemas': relatorio.total_problemas,
-            'problemas_por_severidade': relatorio.problemas_por_severidade,
-            'conformidade_wcag': relatorio.conformidade_wcag,
-            'conformidade_abnt': relatorio.conformidade_abnt,
-            'recomendacoes': relatorio.recomendacoes_priorizadas,
-            'problemas': [
-                {
-                    'criterio': p.criterio,
-                    'descricao': p.descricao,
-                    'severidade': p.severidade.value,
-                    'nivel_wcag': p.nivel_wcag.value,
-                    'sugestao': p.sugestao,
-                    'referencia_wcag': p.referencia_wcag,
-                    'referencia_abnt': p.referencia_abnt,
-                    'codigo_exemplo': p.codigo_exemplo
-                }
-                for p in relatorio.problemas
-            ]
-        }
+                                arquivo: str = "relatorio_acessibilidade.json",
+                                indentar: bool = True):
+        """
+        Exporta relatório em formato JSON
         
-        with open(arquivo, 'w', encoding='utf-8') as f:
-            json.dump(dados, f, ensure_ascii=False, indent=2)
+        Args:
+            relatorio: Relatório a exportar
+            arquivo: Caminho do arquivo de saída
+            indentar: Indenta o JSON para leitura; False grava a forma
+                compacta, menor e mais rápida para relatórios grandes
+        """
+        # Montado uma vez por relatório; exportações repetidas reaproveitam
+        dados = relatorio.to_json_dict()
+        
+        # Buffer de 1 MiB: relatórios grandes são gravados em poucas chamadas
+        buffer = 1 << 20
+        if orjson is not None:
+            opcoes = orjson.OPT_INDENT_2 if indentar else 0
+            with open(arquivo, 'wb', buffering=buffer) as f:
+                f.write(orjson.dumps(dados, option=opcoes))
+        else:
+            import json  # Sob demanda: só a exportação sem orjson precisa
+            formato = {'indent': 2} if indentar else {'separators': (',', ':')}
+            with open(arquivo, 'w', encoding='utf-8', buffering=buffer) as f:
+                json.dump(dados, f, ensure_ascii=False, **formato)
         
         print(f"Relatório exportado para: {arquivo}")
     
-    def imprimir_relatorio(self, relatorio: RelatorioAcessibilidade):
-        """Imprime relatório formatado no console"""
-        print("\n" + "="*80)
-        print("RELATÓRIO DE AVALIAÇÃO DE ACESSIBILIDADE WEB")
-        print("="*80)
-        print(f"\nURL Avaliada: {relatorio.url}")
-        print(f"Data da Avaliação: {relatorio.data_avaliacao}")
-        print(f"\nPONTUAÇÃO GERAL: {relatorio.pontuacao_geral}/100")
+    def imprimir_relatorio(self, relatorio: RelatorioAcessibilidade, *,
+                           forcar: bool = False):
+        """
+        Imprime relatório formatado no console
+        
+        Se a saída padrão for o dispositivo nulo, a formatação é pulada.
+        Saídas redirecionadas para arquivos ou pipes são impressas normalmente.
+        
+        Args:
+            relatorio: Relatório a imprimir
+            forcar: Formata e escreve mesmo quando a saída é descartada
+        """
+        if not forcar and _saida_descartada():
+            return
+        
+        linhas = []
+        linha = linhas.append
+        
+        linha("\n" + "="*80)
+        linha("RELATÓRIO DE AVALIAÇÃO DE ACESSIBILIDADE WEB")
+        linha("="*80)
+        linha(f"\nURL Avaliada: {relatorio.url}")
+        linha(f"Data da Avaliação: {relatorio.data_avaliacao}")
+        linha(f"\nPONTUAÇÃO GERAL: {relatorio.pontuacao_geral}/100")
         
         # Classificação
         if relatorio.pontuacao_geral >= 90:
@@ -886,55 +1860,61 @@ class AgenteAcessibilidade:
         else:
             classificacao = "Necessita Melhorias Urgentes"
         
-        print(f"Classificação: {classificacao}")
+        linha(f"Classificação: {classificacao}")
         
         # Resumo de problemas
-        print(f"\nTotal de Problemas: {relatorio.total_problemas}")
-        print("\nDistribuição por Severidade:")
+        linha(f"\nTotal de Problemas: {relatorio.total_problemas}")
+        linha("\nDistribuição por Severidade:")
         for severidade, count in relatorio.problemas_por_severidade.items():
             if count > 0:
-                emoji = {"Crítico": "", "Grave": "", "Moderado": "", "Leve": ""}
-                print(f"  {emoji.get(severidade, '•')} {severidade}: {count}")
+                linha(f"  {_EMOJI_SEVERIDADE.get(severidade, '•')} {severidade}: {count}")
         
         # Conformidade
-        print("\nCONFORMIDADE COM NORMAS:")
-        print("\nWCAG 2.2:")
+        linha("\nCONFORMIDADE COM NORMAS:")
+        linha("\nWCAG 2.2:")
         for nivel, conforme in relatorio.conformidade_wcag.items():
             status = "Conforme" if conforme else "Não Conforme"
-            print(f"  {nivel}: {status}")
+            linha(f"  {nivel}: {status}")
         
-        print("\nABNT NBR 17225:2025:")
+        linha("\nABNT NBR 17225:2025:")
         for criterio, conforme in relatorio.conformidade_abnt.items():
             status = "Conforme" if conforme else "Não Conforme"
-            print(f"  {criterio}: {status}")
+            linha(f"  {criterio}: {status}")
         
         # Recomendações
-        print("\nRECOMENDAÇÕES PRIORIZADAS:")
+        linha("\nRECOMENDAÇÕES PRIORIZADAS:")
         for i, rec in enumerate(relatorio.recomendacoes_priorizadas, 1):
-            print(f"\n{i}. {rec}")
+            linha(f"\n{i}. {rec}")
         
         # Detalhes dos problemas
-        if relatorio.problemas:
-            print("\n" + "="*80)
-            print("DETALHAMENTO DOS PROBLEMAS ENCONTRADOS")
-            print("="*80)
+        problemas = relatorio.problemas
+        total = len(problemas)
+        if total:
+            linha("\n" + "="*80)
+            linha("DETALHAMENTO DOS PROBLEMAS ENCONTRADOS")
+            linha("="*80)
             
-            for i, problema in enumerate(relatorio.problemas[:10], 1):  # Primeiros 10
-                print(f"\n{i}. {problema.criterio}")
-                print(f"   Severidade: {problema.severidade.value}")
-                print(f"   Descrição: {problema.descricao}")
-                print(f"   Sugestão: {problema.sugestao}")
-                print(f"   Referência: {problema.referencia_wcag} | {problema.referencia_abnt}")
-                if problema.codigo_exemplo:
-                    print(f"   Exemplo: {problema.codigo_exemplo[:80]}...")
+            limite = 10  # Primeiros 10; islice evita copiar a lista
+            for i, problema in enumerate(islice(problemas, limite), 1):
+                linha(f"\n{i}. {problema.criterio}")
+                linha(f"   Severidade: {problema.severidade.value}")
+                linha(f"   Descrição: {problema.descricao}")
+                linha(f"   Sugestão: {problema.sugestao}")
+                linha(f"   Referência: {problema.referencia_wcag} | {problema.referencia_abnt}")
+                exemplo = problema.codigo_exemplo
+                if exemplo:
+                    linha(f"   Exemplo: {exemplo[:80]}...")
             
-            if len(relatorio.problemas) > 10:
-                print(f"\n... e mais {len(relatorio.problemas) - 10} problemas.")
-                print("Exporte o relatório completo em JSON para ver todos os detalhes.")
+            if total > limite:
+                linha(f"\n... e mais {total - limite} problemas.")
+                linha("Exporte o relatório completo em JSON para ver todos os detalhes.")
+        
+        linha("\n" + "="*80)
+        linha("Avaliação concluída!")
+        linha("="*80 + "\n")
         
-        print("\n" + "="*80)
-        print("Avaliação concluída!")
-        print("="*80 + "\n")
+        # Uma única escrita em vez de um print (lock + write) por linha
+        sys.stdout.write("\n".join(linhas) + "\n")
 
 
 def main():